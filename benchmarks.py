@@ -0,0 +1,452 @@
+"""A benchmark suite for the hot paths of validation, formatting, and
+type formation
+
+Each benchmark is timed at several input sizes, and the results can be
+written as JSON and compared against a stored baseline:
+
+	python benchmarks.py --json results.json --baseline baseline.json
+
+exits with a non-zero status if any result is slower than its baseline
+by more than the threshold; `--save-baseline` stores a new baseline.
+`--startup` also times importing each module, and running `tfa.py` to
+its first prompt, exiting with a non-zero status if any is over budget
+"""
+
+import argparse
+import functools as ft
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+import types
+
+from abc import ABC
+
+import numpy as np
+
+from typeworker import *
+from unclassed import *
+from tfa import TypeRegistry, TypeStructor
+
+########################################################################
+
+class BenchMethod( TypeMethod ):
+	"""A minimal TypeMethod, so that only construction is timed"""
+
+	__slots__ = ()
+
+	@staticmethod
+	def init( form, data ):
+
+		return ( form, data )
+
+########################################################################
+
+def benchCheckLimits( size ):
+	"""`checkLimits` of a value which meets `size` limits"""
+
+	limits = [ ( "__le__", ( [ 0 ], [ size ] ) ) for _ in range( size ) ]
+
+	return ( lambda : checkLimits( size // 2, limits ) )
+
+########################################################################
+
+def benchCheckBounds( size ):
+	"""`checkLimits` of a value against one limit of `size` bounds"""
+
+	limits = [ ( "__le__", ( list( range( size ) ), list( range( size, 2 * size ) ) ) ) ]
+
+	return ( lambda : checkLimits( size, limits ) )
+
+########################################################################
+
+def benchCheckFrozenBounds( size ):
+	"""`checkLimits` of a value against one tuple limit of `size` bounds
+
+	Tuple limits are found by identity and their bounds are tightened
+	on compilation, so this should not grow with `size`
+	"""
+
+	limits = ( ( "__le__", ( tuple( range( size ) ), tuple( range( size, 2 * size ) ) ) ), )
+
+	return ( lambda : checkLimits( size, limits ) )
+
+########################################################################
+
+def benchCheckLimitsBatch( size ):
+	"""`checkLimitsBatch` of `size` values against a few limits"""
+
+	values = np.arange( size )
+
+	limits = [ ( "__le__", ( [ 0 ], [ size ] ) ), IntervalIndex( [ ( 0, size // 2 ) ] ), DomainMask( range( 10 ) ) ]
+
+	return ( lambda : checkLimitsBatch( values, limits ) )
+
+########################################################################
+
+def benchLimitReport( size ):
+	"""Rendering the report of a value failing `size` limits"""
+
+	limits = [ ( "__le__", ( [ 0 ], [ 1 ] ) ) for _ in range( size ) ]
+
+	limitsCheck = compileLimits( limits, int ).check( 2 )
+
+	return ( lambda : str( LimitReport( limits, limitsCheck ) ) )
+
+########################################################################
+
+def benchAutoFormat( size ):
+	"""`autoFormat` of `size` elements with a list of seperators"""
+
+	( collection, selection, sep ) = ( list( range( size ) ), [ True ] * size, [ ", " ] * size )
+
+	return ( lambda : autoFormat( collection, selection, sep = sep ) )
+
+########################################################################
+
+def benchCheckCollectionType( size ):
+	"""`checkCollectionType` of a heterogeneous list of `size`"""
+
+	collection = [ 0, "" ] * ( size // 2 )
+
+	return ( lambda : checkCollectionType( int, collection ) )
+
+########################################################################
+
+def benchTypeMethodConstruction( size ):
+	"""Constructing `size` TypeMethods, each calling `init`"""
+
+	infos = [ ( form, form + 1 ) for form in range( size ) ]
+
+	return ( lambda : [ BenchMethod( info ) for info in infos ] )
+
+########################################################################
+
+def benchTypeStructorDispatch( size ):
+	"""`constructMany` of `size` instances of a formed type"""
+
+	class Structor:
+
+		constructor = destructor = staticmethod( lambda args : args )
+
+	typeMap = ( lambda constructor, destructor, args : constructor( args ) )
+
+	structor = TypeStructor( ( typeMap, [ ( "a", Structor ) ], [ ( "a", Structor ) ] ) )
+
+	argsSeq = list( range( size ) )
+
+	return ( lambda : structor.constructMany( 0, argsSeq ) )
+
+########################################################################
+
+def benchReformDependents( size ):
+	"""Editing the base of a chain of `size` types, then constructing
+
+	Every type of the chain is re-formed, and an instance is then
+	constructed through all of them, from the last type of the chain
+	"""
+
+	class Structor:
+
+		constructor = destructor = staticmethod( lambda args : args )
+
+		def __call__( self, args ):
+
+			return args
+
+	# Only the destructor is mapped, so constructing through the chain
+	# makes one call per type rather than doubling at every type
+	typeMap = ( lambda constructor, destructor, args : destructor( args ) )
+
+	( registry, forms ) = ( TypeRegistry(), it.cycle( ( Structor(), Structor() ) ) )
+
+	registry.form( "type0", ( typeMap, [ ( "a", next( forms ) ) ], [ ( "a", next( forms ) ) ] ) )
+
+	for index in range( 1, size ):
+
+		registry.form( "type" + str( index ), ( typeMap, [ ( "a", "type" + str( index - 1 ) ) ], [ ( "a", "type" + str( index - 1 ) ) ] ) )
+
+	def edit():
+
+		structor = next( forms )
+
+		registry.form( "type0", ( typeMap, [ ( "a", structor ) ], [ ( "a", structor ) ] ) )
+
+		return registry[ "type" + str( size - 1 ) ][ 1 ].construct( "a", size )
+
+	return edit
+
+########################################################################
+
+# Every benchmark of the suite, with the sizes it is timed at
+benchmarks = {
+	"checkLimits" : ( benchCheckLimits, ( 1, 10, 100 ) ),
+	"checkBounds" : ( benchCheckBounds, ( 1, 100, 10000 ) ),
+	"checkFrozenBounds" : ( benchCheckFrozenBounds, ( 1, 100, 10000 ) ),
+	"checkLimitsBatch" : ( benchCheckLimitsBatch, ( 100, 10000, 1000000 ) ),
+	"limitReport" : ( benchLimitReport, ( 10, 100, 1000 ) ),
+	"autoFormat" : ( benchAutoFormat, ( 100, 10000, 100000 ) ),
+	"checkCollectionType" : ( benchCheckCollectionType, ( 100, 10000, 1000000 ) ),
+	"typeMethodConstruction" : ( benchTypeMethodConstruction, ( 100, 10000 ) ),
+	"typeStructorDispatch" : ( benchTypeStructorDispatch, ( 100, 10000, 1000000 ) ),
+	"reformDependents" : ( benchReformDependents, ( 1, 10, 100 ) ),
+	}
+
+########################################################################
+
+def timeBenchmark( func, repeat = 5 ):
+	"""Returns the best time, in seconds, of a single call to `func`
+
+	The number of calls per timing is chosen by `autorange`, and the
+	best of `repeat` timings is taken
+	"""
+
+	timer = timeit.Timer( func )
+
+	( number, _ ) = timer.autorange()
+
+	return min( timer.repeat( repeat, number ) ) / number
+
+########################################################################
+
+def runBenchmarks( names = None, repeat = 5 ):
+	"""Runs the benchmarks named `names` -- or all -- at every size
+
+	Returns the results as a dict of seconds, keyed on the name and
+	then the size, as a string, of each benchmark
+	"""
+
+	return {
+		name : { str( size ) : timeBenchmark( setup( size ), repeat ) for size in sizes }
+		for ( name, ( setup, sizes ) ) in benchmarks.items()
+		if ( ( names is None ) or ( name in names ) )
+		}
+
+########################################################################
+
+def compareResults( results, baseline, threshold = 0.25 ):
+	"""Returns the results which regressed from `baseline`
+
+	A result regresses if it is slower than its baseline by more than
+	`threshold`, as a fraction; each regression is given as a tuple of
+	`( name, size, baseline, result )`
+	"""
+
+	return [
+		( name, size, baseline[ name ][ size ], seconds )
+		for ( name, sizes ) in results.items()
+		for ( size, seconds ) in sizes.items()
+		if ( ( size in baseline.get( name, {} ) ) and ( seconds > ( 1 + threshold ) * baseline[ name ][ size ] ) )
+		]
+
+########################################################################
+
+def unslotted( cls ):
+	"""Returns a copy of the class `cls` with no `__slots__`
+
+	Every class along the MRO of `cls` -- other than `object` and
+	`ABC` -- is copied with fresh TypeProperties, so the copy behaves
+	as `cls` does but its instances keep their attributes in a
+	`__dict__`
+	"""
+
+	bases = [ ABC ]
+
+	for base in reversed( cls.__mro__[ : -1 ] ):
+
+		if( base is ABC ):
+			continue
+
+		namespace = { 
+			name : ( TypeProperty() if isinstance( attribute, TypeProperty ) else attribute ) 
+			for ( name, attribute ) in vars( base ).items() 
+			if ( name not in ( "__slots__", "__dict__", "__weakref__", "typePropertyCount" ) ) and ( not isinstance( attribute, types.MemberDescriptorType ) ) 
+			}
+
+		bases = [ type( base )( base.__name__, tuple( bases ), namespace ) ]
+
+	return bases[ 0 ]
+
+########################################################################
+
+def bytesPerInstance( constructor, number = 10000 ):
+	"""Returns the mean bytes allocated by a call to `constructor`
+
+	Every result is kept alive until it has been measured, so this
+	includes the instance and all it holds
+	"""
+
+	infos = [ ( form, form + 1 ) for form in range( number ) ]
+
+	tracemalloc.start()
+
+	before = tracemalloc.take_snapshot()
+
+	instances = [ constructor( info ) for info in infos ]
+
+	after = tracemalloc.take_snapshot()
+
+	tracemalloc.stop()
+
+	allocated = sum( stat.size_diff for stat in after.compare_to( before, "filename" ) )
+
+	return ( allocated - sys.getsizeof( instances ) ) / number
+
+########################################################################
+
+def benchTypeMethodMemory( number = 10000 ):
+	"""Memory benchmark for the slotted TypeMethod layout
+
+	Returns the bytes per instance of the very same TypeMethod without
+	and with `__slots__`, in that order
+	"""
+
+	return ( bytesPerInstance( unslotted( BenchMethod ), number ), bytesPerInstance( BenchMethod, number ) )
+
+########################################################################
+
+# The directory of the modules, which every startup is run from
+here = os.path.dirname( os.path.abspath( __file__ ) )
+
+# The seconds a startup may take before it is counted as too slow
+startupBudget = 0.1
+
+########################################################################
+
+def timeImport( module ):
+	"""Returns the seconds taken by a fresh interpreter to import `module`
+
+	This includes the start of the interpreter itself, as paid by every
+	short run of `tfa.main`
+	"""
+
+	start = time.perf_counter()
+
+	subprocess.run( [ sys.executable, "-c", "import " + module ], cwd = here, check = True )
+
+	return time.perf_counter() - start
+
+########################################################################
+
+def timeFirstPrompt( marker = b">>>" ):
+	"""Returns the seconds from running `tfa.py` to its first prompt
+
+	The prompt is seen once `marker` is written to stdout, after which
+	an answer is given so that the run can finish
+	"""
+
+	start = time.perf_counter()
+
+	process = subprocess.Popen( [ sys.executable, "tfa.py" ], cwd = here, stdin = subprocess.PIPE, stdout = subprocess.PIPE )
+
+	output = b""
+
+	while( marker not in output ):
+
+		chunk = os.read( process.stdout.fileno(), 4096 )
+
+		if( not chunk ):
+			raise( RuntimeError( "tfa.py exited before prompting" ) )
+
+		output += chunk
+
+	elapsed = time.perf_counter() - start
+
+	process.communicate( b"0\n" )
+
+	return elapsed
+
+########################################################################
+
+def benchStartup( repeat = 5 ):
+	"""Startup benchmark, the import and first-prompt latencies
+
+	Returns the fastest of `repeat` runs for each, in seconds
+	"""
+
+	startups = { "import " + module : ft.partial( timeImport, module ) for module in ( "unclassed", "typeworker", "tfa" ) }
+
+	startups[ "first prompt" ] = timeFirstPrompt
+
+	return { name : min( startup() for _ in range( repeat ) ) for ( name, startup ) in startups.items() }
+
+########################################################################
+
+def main():
+	"""Runs the suite, printing and -- optionally -- storing results"""
+
+	parser = argparse.ArgumentParser( description = "Runs the benchmark suite" )
+
+	parser.add_argument( "names", nargs = "*", help = "the benchmarks to run, or all of them" )
+	parser.add_argument( "--repeat", type = int, default = 5 )
+	parser.add_argument( "--json", help = "a path to write the results to, as JSON" )
+	parser.add_argument( "--baseline", help = "a path to a baseline to compare the results against" )
+	parser.add_argument( "--save-baseline", help = "a path to store the results to, as a baseline" )
+	parser.add_argument( "--threshold", type = float, default = 0.25, help = "the slowdown, as a fraction, counted as a regression" )
+	parser.add_argument( "--memory", action = "store_true", help = "also measure the bytes per TypeMethod" )
+	parser.add_argument( "--startup", action = "store_true", help = "also measure the import and first-prompt latencies" )
+	parser.add_argument( "--startup-budget", type = float, default = startupBudget, help = "the seconds a startup may take" )
+
+	args = parser.parse_args()
+
+	results = runBenchmarks( args.names or None, args.repeat )
+
+	for ( name, sizes ) in results.items():
+
+		for ( size, seconds ) in sizes.items():
+
+			print( format( name, "24" ), format( size, ">8" ), format( seconds * 1e6, ">14.3f" ), "us" )
+
+	if( args.memory ):
+
+		print( "TypeMethod bytes per instance ( dict, slots ):", benchTypeMethodMemory() )
+
+	startup = benchStartup( args.repeat ) if args.startup else {}
+
+	for ( name, seconds ) in startup.items():
+
+		print( format( name, "33" ), format( seconds * 1e3, ">14.3f" ), "ms" )
+
+	document = { 
+		"python" : platform.python_version(), 
+		"numpy" : np.__version__, 
+		"results" : results,
+		"startup" : startup,
+		}
+
+	for path in ( args.json, args.save_baseline ):
+
+		if( path ):
+
+			with open( path, "w" ) as file:
+				json.dump( document, file, indent = "\t" )
+
+	if( args.baseline ):
+
+		with open( args.baseline ) as file:
+			baseline = json.load( file )[ "results" ]
+
+		regressions = compareResults( results, baseline, args.threshold )
+
+		for ( name, size, before, after ) in regressions:
+
+			print( "Regression:", name, size, format( before * 1e6, ".3f" ), "us ->", format( after * 1e6, ".3f" ), "us" )
+
+		if( regressions ):
+			sys.exit( 1 )
+
+	overBudget = [ name for ( name, seconds ) in startup.items() if ( seconds > args.startup_budget ) ]
+
+	for name in overBudget:
+
+		print( "Over budget:", name, format( startup[ name ] * 1e3, ".3f" ), "ms >", format( args.startup_budget * 1e3, ".3f" ), "ms" )
+
+	if( overBudget ):
+		sys.exit( 1 )
+
+if __name__ == '__main__':
+	main()
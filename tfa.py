@@ -1,100 +1,1250 @@
+import bisect
+import collections as co
+import functools as ft
+import itertools as it
+import numbers
+import os
+import sys
+import time
+
+from typeworker import *
+from unclassed import *
 
+########################################################################
+
+def dispatchTable( callables ):
+	"""Returns an index-addressable, array-backed table of `callables`"""
+
+	callables = list( callables )
+
+	table = np.empty( len( callables ), dtype = object )
+
+	for ( index, callable ) in enumerate( callables ):
+
+		table[ index ] = callable
+
+	return table
+
+########################################################################
+
+def composeConstructor( typeMap, source, target ):
+	"""Returns the constructor chain from `source` to `target`
+
+	The constructor and destructor of `source` are mapped by `typeMap`
+	and then passed to the constructor of `target`; every attribute is
+	looked up once, here, rather than on every construction
+	"""
+
+	( sourceConstructor, sourceDestructor, targetConstructor ) = ( source.constructor, source.destructor, target.constructor )
+
+	return ( lambda args : targetConstructor( typeMap( sourceConstructor, sourceDestructor, args ) ) )
+
+########################################################################
+
+class StructorEntry:
+	"""The constructor and destructor of a TypeStructor at one index
+
+	Lets a formed type stand in the type lists of another formation:
+	`constructor` and `destructor` are plain callables, and calling the
+	entry destructs, as the destructor tables do
+	"""
+
+	__slots__ = ( "structor", "index", "constructor", "destructor" )
+
+	def __init__( self, structor, index ):
+
+		( self.structor, self.index ) = ( structor, index )
+
+		( self.constructor, self.destructor ) = ( structor.constructor[ index ], structor.destructor[ index ] )
+
+	def __call__( self, args ):
+
+		return self.destructor( args )
+
+########################################################################
+
+class TypeStructor( TypeWorker ):
+	"""TypeWorker derived class for both 'Type*structor's
+
+	The composed constructor and destructor chains of a `blueprint` are
+	built once, into the dispatch tables `constructor` and `destructor`,
+	which are addressed by index -- or by label, through
+	`constructorIndex` and `destructorIndex`
+	"""
+
+	__slots__ = ( "__typeMap", "__constructorList", "__destructorList", "__entries", "constructor", "destructor", "constructorIndex", "destructorIndex" )
+
+	def __init__( self, blueprint, args = None ):
+
+		TypeWorker.__init__( self, ( 0, None, blueprint ), args )
+
+	####################################################################
+
+	def __initPool( self, poolInfo ):
+
+		pass
+
+	####################################################################
+
+	def initWorker( self, blueprint ):
+
+		( self.__typeMap, self.__constructorList, self.__destructorList ) = blueprint
+
+		self.__entries = {}
+
+		( self.constructorIndex, self.destructorIndex ) = [ 
+			{ label : index for ( index, ( label, _ ) ) in enumerate( typeList ) } 
+			for typeList in ( self.__constructorList, self.__destructorList ) 
+			]
+
+		# Each constructor is composed once, binding its own index's
+		# entries rather than whichever the loop ended on
+		self.constructor = dispatchTable( 
+			composeConstructor( self.__typeMap, self.__constructorList[ t ][ 1 ], self.__destructorList[ t ][ 1 ] )
+			for t in range( len( self.__constructorList ) )
+			)
+
+		self.destructor = dispatchTable( structor for ( _, structor ) in self.__destructorList )
+
+		return self.constructor
+
+	####################################################################
+
+	def entry( self, key = 0 ):
+		"""Returns the `StructorEntry` at `key`, an index or a label
+
+		Entries are kept, so that every formation using an entry again
+		holds the very same object, and is interned as the same
+		"""
+
+		index = key if isinstance( key, numbers.Integral ) else self.constructorIndex[ key ]
+
+		try:
+
+			return self.__entries[ index ]
+
+		except KeyError:
+
+			entry = self.__entries[ index ] = StructorEntry( self, index )
+
+			return entry
+
+	####################################################################
+
+	def construct( self, key, args ):
+		"""Constructs from `args` with the constructor at `key`
+
+		`key` is either an index or a label of the constructor list
+		"""
+
+		return self.constructor[ key if isinstance( key, numbers.Integral ) else self.constructorIndex[ key ] ]( args )
+
+	####################################################################
+
+	def destruct( self, key, args ):
+		"""Destructs `args` with the destructor at `key`
+
+		`key` is either an index or a label of the destructor list
+		"""
+
+		return self.destructor[ key if isinstance( key, numbers.Integral ) else self.destructorIndex[ key ] ]( args )
+
+	####################################################################
+
+	def constructMany( self, key, argsSeq ):
+		"""Constructs from each of `argsSeq` with the constructor at `key`
+
+		The constructor is looked up once, so each construction is a
+		single call
+		"""
+
+		return list( map( self.constructor[ key if isinstance( key, numbers.Integral ) else self.constructorIndex[ key ] ], argsSeq ) )
+
+	####################################################################
+
+	def destructMany( self, key, argsSeq ):
+		"""Destructs each of `argsSeq` with the destructor at `key`
+
+		The destructor is looked up once, so each destruction is a
+		single call
+		"""
+
+		return list( map( self.destructor[ key if isinstance( key, numbers.Integral ) else self.destructorIndex[ key ] ], argsSeq ) )
+
+	####################################################################
+
+	def columnar( self, fields, capacity = 0 ):
+		"""Returns a new `ColumnStore` of instances of this formed type
+
+		`fields` are the `( name, dtype )` pairs of the structured
+		dtype which the instances are stored in
+		"""
+
+		return ColumnStore( fields, self, capacity )
+
+########################################################################
+
+class ColumnStore:
+	"""Columnar storage for the instances of a formed type
+
+	Instances are rows of a NumPy structured array, so a field of every
+	instance is a single column, and each instance is a lightweight
+	view onto its row; instances are constructed and destructed in bulk
+	through the `structor` of the formed type, if there is one.
+
+	A view -- from indexing, `rows`, or `column` -- only writes through
+	until the store next grows or has instances removed, as either may
+	move the rows; hold on to indices rather than views across those
+	"""
+
+	__slots__ = ( "dtype", "structor", "size", "__rows" )
+
+	def __init__( self, fields, structor = None, capacity = 0 ):
+
+		( self.dtype, self.structor ) = ( np.dtype( fields ), structor )
+
+		self.__rows = np.zeros( capacity, dtype = self.dtype )
+
+		self.size = 0
+
+	####################################################################
+
+	def __len__( self ):
+
+		return self.size
+
+	####################################################################
+
+	@property
+	def rows( self ):
+		"""The structured array of every instance, as a view"""
+
+		return self.__rows[ : self.size ]
+
+	####################################################################
+
+	def __getitem__( self, index ):
+
+		# Indexing a structured array with an integer gives a view of
+		# the row, so writing to its fields writes to the store -- until
+		# `extend` reallocates or `remove` compacts the rows
+		return self.rows[ index ]
+
+	####################################################################
+
+	def column( self, name ):
+		"""Returns the field `name` of every instance, as a view"""
+
+		return self.rows[ name ]
+
+	####################################################################
+
+	def __reserve( self, size ):
+		"""Grows the capacity -- at least doubling it -- to fit `size`"""
+
+		if( size > len( self.__rows ) ):
+
+			rows = np.zeros( max( size, 2 * len( self.__rows ) ), dtype = self.dtype )
+
+			rows[ : self.size ] = self.rows
+
+			self.__rows = rows
+
+	####################################################################
+
+	def extend( self, records ):
+		"""Appends `records` as instances, returning their indices
+
+		`records` is a structured array, a dict of columns, or a
+		sequence of tuples with a value for each field
+		"""
+
+		if( isinstance( records, dict ) ):
+
+			columns = records
+
+			records = np.zeros( len( next( iter( columns.values() ), () ) ), dtype = self.dtype )
+
+			for ( name, column ) in columns.items():
+
+				records[ name ] = column
+
+		else:
+
+			records = np.asarray( records, dtype = self.dtype ) if isinstance( records, np.ndarray ) else np.array( [ tuple( record ) for record in records ], dtype = self.dtype )
+
+		( start, stop ) = ( self.size, self.size + len( records ) )
+
+		self.__reserve( stop )
+
+		self.__rows[ start : stop ] = records
+
+		self.size = stop
+
+		return np.arange( start, stop )
+
+	####################################################################
+
+	def append( self, record ):
+		"""Appends a single `record`, returning its index"""
+
+		return self.extend( [ record ] )[ 0 ]
+
+	####################################################################
+
+	def remove( self, indices ):
+		"""Removes the instances at `indices`, compacting the store"""
+
+		keep = np.ones( self.size, dtype = bool )
+
+		keep[ indices ] = False
+
+		kept = self.rows[ keep ]
+
+		self.__rows[ : len( kept ) ] = kept
+
+		self.size = len( kept )
+
+	####################################################################
+
+	def constructMany( self, key, argsSeq ):
+		"""Constructs an instance from each of `argsSeq` in bulk
+
+		Uses the constructor at `key` of `structor`, which must give
+		a value for each field; returns the indices of the instances
+		"""
+
+		return self.extend( self.structor.constructMany( key, argsSeq ) )
+
+	####################################################################
+
+	def destructMany( self, key, indices = None ):
+		"""Destructs the instances at `indices` -- or every instance
+
+		Uses the destructor at `key` of `structor` on each instance as a
+		tuple of its fields
+		"""
+
+		rows = self.rows if ( indices is None ) else self.rows[ indices ]
+
+		return self.structor.destructMany( key, rows.tolist() )
+
+########################################################################
+
+# The interned TypeStructors, keyed on their formation
+formedStructors = LRUCache( maxsize = 1024 )
+
+# The interned formed types, keyed on their name and formation
+formedTypes = LRUCache( maxsize = 4096 )
+
+instruments.watch( "formedStructors", formedStructors )
+
+instruments.watch( "formedTypes", formedTypes )
+
+########################################################################
+
+def formationKey( formation ):
+	"""Returns a hashable, structural key equivalent to `formation`
+
+	The type lists are normalized into tuples of `( label, structor )`
+	pairs; None is returned if any part of `formation` is unhashable
+	"""
+
+	( typeMap, constructorList, destructorList ) = formation
+
+	try:
+
+		key = ( typeMap, tuple( map( tuple, constructorList ) ), tuple( map( tuple, destructorList ) ) )
+
+		hash( key )
+
+	except TypeError:
+
+		return None
+
+	return key
+
+########################################################################
+
+def formType( name, formation ):
+	"""Returns the type named `name` formed from `formation`
+
+	Formed types -- and their TypeStructors -- are interned, so forming
+	the same type again is a lookup which gives the very same object
+	"""
+
+	key = formationKey( formation )
+
+	if( key is None ):
+
+		return np.array( ( name, TypeStructor( formation ) ), dtype = object )
+
+	formed = formedTypes.get( ( name, key ) )
+
+	if( formed is None ):
+
+		# The dispatch tables are shared by every name of a formation
+		structor = formedStructors.get( key )
+
+		if( structor is None ):
+
+			structor = TypeStructor( formation )
+
+			formedStructors.put( key, structor )
+
+		formed = np.array( ( name, structor ), dtype = object )
+
+		formedTypes.put( ( name, key ), formed )
+
+	return formed
+
+########################################################################
+
+class TypeFormer( TypeWorker ):
+	"""TypeWorker derived class which holds Type formation info
+
+	A worker responsible for turning representations of types into the
+	type that is being represented
+	"""
+
+	__slots__ = ()
+
+	def initWorker( self, formation ):
+		"""Derived method for creating worker
+
+		`formation` must be a triple containing a 'Structure'
+		function, `typeMap`, a 'Constructor TypeList' `constructorTypes`, 
+		and a 'Destructor TypeList' `destructorTypes`
+		"""
+
+		return ( lambda name : formType( name, formation ) )
+
+########################################################################
+
+# Stands in for any checked argument which was not passed, and so
+# is left to its default
+noArgument = object()
+
+########################################################################
+
+class TypeChecker:
+	"""Enables automatic TypeChecking and Error Reports
+
+	The `checked` decorator validates the arguments and return value of
+	a function against types and limits, with `checkLimits` semantics.
+	Validation plans are cached per call site and per argument type;
+	only 1 in every `sampleRate` calls is checked, and none at all
+	while `enabled` is False
+	"""
+
+	def __init__( self, sampleRate = 1, enabled = True ):
+
+		( self.sampleRate, self.enabled ) = ( sampleRate, enabled )
+
+		# The types registered by name, as `( answerType, limits )`
+		self.types = {}
+
+	####################################################################
+
+	@property
+	def sampleRate( self ):
+
+		return self.__sampleRate
+
+	@sampleRate.setter
+	def sampleRate( self, sampleRate ):
+
+		# Checks are turned off with `enabled`, not a rate of 0
+		if( ( not isinstance( sampleRate, numbers.Integral ) ) or ( sampleRate < 1 ) ):
+
+			raise( ValueError( "The sampleRate must be a positive integer, not " + repr( sampleRate ) ) )
+
+		self.__sampleRate = int( sampleRate )
+
+	def __initWorker( self, workers ):
+		"""
+
+		"""
+
+	####################################################################
+
+	def check( self, oiq, limits, verbose = False ):
+		"""Checks if `oiq` meets `limits` using a compiled validator
+
+		The validator is shared through `compileLimits`, so repeated
+		checks against the same `limits` skip the type pass
+		"""
+
+		return compileLimits( limits, type( oiq ) )( oiq, verbose )
+
+	####################################################################
+
+	def register( self, name, answerType, limits = None ):
+		"""Registers `answerType` and its `limits` under `name`
+
+		A registered name can then be given as the spec of an argument
+		or return value in `checked`
+		"""
+
+		self.types[ name ] = ( answerType, limits )
+
+	####################################################################
+
+	def resolve( self, spec ):
+		"""Returns the `( answerType, limits )` pair given by `spec`
+
+		`spec` is a registered name, a type, or a pair of a type --
+		which may be None, to check only limits -- and its limits
+		"""
+
+		if( isinstance( spec, str ) ):
+			return self.types[ spec ]
+
+		if( isinstance( spec, type ) ):
+			return ( spec, None )
+
+		return tuple( spec )
+
+	####################################################################
+
+	def compile( self, label, spec, valueType ):
+		"""Returns a validator of `spec` for values of `valueType`
+
+		The validator raises a TypeError or a ValueError naming
+		`label`; None is returned if there is nothing to validate
+		"""
+
+		( answerType, limits ) = self.resolve( spec )
+
+		if( ( answerType is not None ) and ( not issubclass( valueType, answerType ) ) ):
+
+			message = label + " must be " + answerType.__name__ + ", not " + valueType.__name__
+
+			def mistyped( value ):
+
+				raise( TypeError( message ) )
+
+			return mistyped
+
+		if( not limits ):
+			return None
+
+		try:
+
+			validator = compileLimits( limits, valueType )
+
+		# If the limits are incompatible with `valueType` we raise the
+		# TypeError whenever a value of that type is validated
+		except TypeError as e:
+
+			def incompatible( value ):
+
+				raise( TypeError( label + ": " + str( e ) ) )
+
+			return incompatible
+
+		def limited( value ):
+
+			# Only once `value` has failed is its report made
+			if( not validator.isMet( value ) ):
+
+				raise( ValueError( label + ": " + str( validator( value, verbose = True ) ) ) )
+
+		return limited
+
+	####################################################################
+
+	def checked( self, returns = None, **specs ):
+		"""Decorator validating arguments and the return value
+
+		Each keyword names an argument and gives its spec -- see
+		`resolve` -- and `returns` gives the spec of the return value
+		"""
+
+		def decorate( func ):
+
+			parameters = list( inspect.signature( func ).parameters )
+
+			# Where each checked argument is found when passed
+			# positionally, if it can be
+			positions = tuple( 
+				( name, parameters.index( name ) if ( name in parameters ) else None, spec ) 
+				for ( name, spec ) in specs.items() 
+				)
+
+			# The plans of this call site, keyed on the argument types
+			( argumentPlans, returnPlans, calls ) = ( {}, {}, it.count() )
+
+			def plan( plans, key, labels, specList ):
+
+				validators = tuple( 
+					self.compile( label, spec, valueType ) 
+					for ( label, spec, valueType ) in zip( labels, specList, key ) 
+					)
+
+				plans[ key ] = validators
+
+				return validators
+
+			labels = tuple( "Argument `" + name + "` of `" + func.__qualname__ + "`" for ( name, _, _ ) in positions )
+
+			returnLabel = ( "The return value of `" + func.__qualname__ + "`", )
+
+			@ft.wraps( func )
+			def wrapper( *args, **kwargs ):
+
+				if( ( not self.enabled ) or ( next( calls ) % self.sampleRate ) ):
+					return func( *args, **kwargs )
+
+				values = [
+					kwargs[ name ] if ( name in kwargs ) else 
+					args[ position ] if ( ( position is not None ) and ( position < len( args ) ) ) else 
+					noArgument
+					for ( name, position, _ ) in positions
+					]
+
+				key = tuple( map( type, values ) )
+
+				validators = argumentPlans.get( key )
+
+				if( validators is None ):
+					validators = plan( argumentPlans, key, labels, [ spec for ( _, _, spec ) in positions ] )
+
+				for ( validator, value ) in zip( validators, values ):
+
+					if( ( validator is not None ) and ( value is not noArgument ) ):
+						validator( value )
+
+				result = func( *args, **kwargs )
+
+				if( returns is not None ):
+
+					key = ( type( result ), )
+
+					( validator, ) = returnPlans.get( key ) or plan( returnPlans, key, returnLabel, ( returns, ) )
+
+					if( validator is not None ):
+						validator( result )
+
+				return result
+
+			return wrapper
+
+		return decorate
+
+########################################################################
+
+def readCommands( stream ):
+	"""A generator of the commands in a script, one per line
+
+	Each line is either line-oriented -- the command's name followed by
+	its answers, seperated by whitespace -- or a JSON object with a
+	"command" and, optionally, a list of "answers"; blank lines and
+	lines starting with `#` are skipped. Yields `( name, answers )`
+	"""
+
+	for line in stream:
+
+		line = line.strip()
+
+		if( ( not line ) or line.startswith( "#" ) ):
+			continue
+
+		if( line.startswith( "{" ) ):
+
+			command = json.loads( line )
+
+			yield ( command[ "command" ], [ str( answer ) for answer in command.get( "answers", () ) ] )
+
+		else:
+
+			( name, *answers ) = line.split()
+
+			yield ( name, answers )
+
+########################################################################
+
+class TypeRegistry:
+	"""The formed types of a TypeAssistant, indexed by name
+
+	Names are kept in a sorted list alongside the mapping, so listing,
+	prefix, and range queries are a bisection and a slice rather than a
+	scan; each of the `indexes` -- a function from a formed type to a
+	hashable key -- is kept up to date on every `register` and `remove`.
+
+	Types formed by `form` from a blueprint naming other registered
+	types are tracked as their dependents, so replacing a type re-forms
+	only its transitive dependents, and removing it removes them
+	"""
+
+	def __init__( self, indexes = None ):
+
+		( self.__types, self.__names, self.__keys ) = ( {}, [], {} )
+
+		# The blueprint and dependencies of each type made by `form`, and
+		# the names of the types depending on each type
+		( self.__blueprints, self.__dependencies, self.__dependents ) = ( {}, {}, co.defaultdict( set ) )
+
+		( self.__indexFunctions, self.__indexes ) = ( {}, {} )
+
+		for ( indexName, keyFunction ) in ( indexes or {} ).items():
+
+			self.addIndex( indexName, keyFunction )
+
+	####################################################################
+
+	def __len__( self ):
+
+		return len( self.__names )
+
+	def __contains__( self, name ):
+
+		return name in self.__types
+
+	def __getitem__( self, name ):
+
+		return self.__types[ name ]
+
+	def __iter__( self ):
+
+		return iter( self.__names.copy() )
+
+	def get( self, name, default = None ):
+
+		return self.__types.get( name, default )
+
+	####################################################################
+
+	def addIndex( self, indexName, keyFunction ):
+		"""Adds the secondary index `indexName`, keyed by `keyFunction`
+
+		The index is built over every type already registered
+		"""
+
+		( self.__indexFunctions[ indexName ], self.__indexes[ indexName ] ) = ( keyFunction, co.defaultdict( dict ) )
+
+		for name in self.__names:
+
+			self.__index( indexName, name, self.__types[ name ] )
+
+	####################################################################
+
+	def __index( self, indexName, name, formed ):
+
+		key = self.__indexFunctions[ indexName ]( formed )
+
+		self.__keys.setdefault( name, {} )[ indexName ] = key
+
+		# Each key's names are kept as a dict, so that updating them is
+		# constant time however many types share the key
+		self.__indexes[ indexName ][ key ][ name ] = None
+
+	####################################################################
+
+	def __unindex( self, name ):
+
+		for ( indexName, key ) in self.__keys.pop( name, {} ).items():
+
+			bucket = self.__indexes[ indexName ][ key ]
+
+			del bucket[ name ]
+
+			if( not bucket ):
+				del self.__indexes[ indexName ][ key ]
+
+	####################################################################
+
+	def __store( self, name, formed ):
+
+		if( name in self.__types ):
+
+			self.__unindex( name )
+
+		else:
+
+			bisect.insort( self.__names, name )
+
+		self.__types[ name ] = formed
+
+		for indexName in self.__indexFunctions:
+
+			self.__index( indexName, name, formed )
+
+	####################################################################
+
+	def __unlink( self, name ):
+
+		self.__blueprints.pop( name, None )
+
+		for dependency in self.__dependencies.pop( name, () ):
+
+			self.__dependents[ dependency ].discard( name )
+
+	####################################################################
+
+	def register( self, name, formed, pool = None ):
+		"""Registers `formed` as `name`, replacing any type of that name
+
+		Only the entries of `name` in the secondary indexes change, and
+		only the dependents of `name` are re-formed -- see `reform`
+		"""
+
+		self.__unlink( name )
+
+		self.__store( name, formed )
+
+		self.reform( name, pool )
+
+	####################################################################
+
+	def resolve( self, blueprint ):
+		"""Returns the formation of `blueprint`, and the names it uses
+
+		`blueprint` is a formation whose type lists may give the name
+		of a registered type in place of a structor, which stands for
+		the first entry -- see `TypeStructor.entry` -- of its structor;
+		a KeyError is raised if a named type is not registered
+		"""
+
+		( typeMap, constructorList, destructorList ) = blueprint
+
+		( formation, dependencies ) = ( [ typeMap ], set() )
+
+		for typeList in ( constructorList, destructorList ):
+
+			formation.append( [ 
+				( label, self.__types[ structor ][ 1 ].entry() if isinstance( structor, str ) else structor ) 
+				for ( label, structor ) in typeList 
+				] )
 
-class TypeStructor( TypeWorker ):
-	"""TypeWorker derived class for both 'Type*structor's
+			dependencies.update( structor for ( _, structor ) in typeList if isinstance( structor, str ) )
 
-	"""
+		return ( tuple( formation ), dependencies )
 
-	def __initPool( self, poolInfo ):
+	####################################################################
 
-		pass
+	def form( self, name, blueprint, pool = None ):
+		"""Forms and registers the type `name` from `blueprint`
 
-	def __initWorker( self, blueprint ):
+		The types named in `blueprint` become dependencies of `name`,
+		which is re-formed whenever one of them is; a ValueError is
+		raised if `name` would come to depend on itself
+		"""
 
-		( self.__typeMap, self.__constructorList, self.__destructorList ) = blueprint
+		( formation, dependencies ) = self.resolve( blueprint )
+
+		if( ( name in dependencies ) or ( not dependencies.isdisjoint( self.dependents( name, transitive = True ) ) ) ):
+
+			raise( ValueError( "The type " + repr( name ) + " would depend on itself" ) )
+
+		formed = formType( name, formation )
+
+		self.__unlink( name )
+
+		( self.__blueprints[ name ], self.__dependencies[ name ] ) = ( blueprint, frozenset( dependencies ) )
+
+		for dependency in dependencies:
+
+			self.__dependents[ dependency ].add( name )
+
+		self.__store( name, formed )
+
+		self.reform( name, pool )
+
+		return formed
+
+	####################################################################
+
+	def blueprint( self, name ):
+		"""Returns the blueprint `name` was formed from, if it was"""
+
+		return self.__blueprints.get( name )
+
+	####################################################################
+
+	def dependencies( self, name ):
+		"""Returns the names of the types `name` was formed from"""
+
+		return set( self.__dependencies.get( name, () ) )
+
+	####################################################################
+
+	def dependents( self, name, transitive = False ):
+		"""Returns the names of the types formed from `name`
+
+		If `transitive`, the types formed from those are included, and
+		so on
+		"""
+
+		dependents = set( self.__dependents.get( name, () ) )
+
+		if( transitive ):
+
+			frontier = list( dependents )
+
+			while( frontier ):
+
+				for dependent in self.__dependents.get( frontier.pop(), () ):
+
+					if( dependent not in dependents ):
+
+						dependents.add( dependent )
+
+						frontier.append( dependent )
+
+		return dependents
+
+	####################################################################
+
+	def waves( self, names ):
+		"""Returns `names` in topological order, as a list of waves
+
+		Every type in a wave depends only on types outside of `names`
+		or in earlier waves, so the types of a wave are independent
+		"""
+
+		names = set( names )
+
+		# We count the dependencies of each type that are yet to form
+		waiting = { name : len( self.__dependencies.get( name, frozenset() ) & names ) for name in names }
+
+		( waves, wave ) = ( [], sorted( name for ( name, count ) in waiting.items() if not count ) )
+
+		while( wave ):
+
+			waves.append( wave )
+
+			ready = []
+
+			for name in wave:
+
+				for dependent in self.__dependents.get( name, () ):
+
+					if( dependent in waiting ):
+
+						waiting[ dependent ] -= 1
+
+						if( not waiting[ dependent ] ):
+							ready.append( dependent )
+
+			wave = sorted( ready )
+
+		return waves
+
+	####################################################################
+
+	def reform( self, name, pool = None ):
+		"""Re-forms every transitive dependent of `name`, in order
+
+		The types of each of `waves` are re-formed together through
+		`pool`, as none depends on another; by default they are formed
+		in-line. As the formed types hold their structors' functions,
+		`pool` must share memory -- e.g. a "thread" SharedPool
+		"""
+
+		pool = InlinePool() if ( pool is None ) else pool
 
-		labels = np.array( [ t[ 0 ] for t in np.hstack( ( self.__constructorList, self.__destructorList ) )
+		reformName = ( lambda dependent : formType( dependent, self.resolve( self.__blueprints[ dependent ] )[ 0 ] ) )
 
-		( numOfC, numOfD ) = it.map( lambda iterable : range( len ( iterable ) ), ( self.__constructorList, self.__destructorList ) )
+		for wave in self.waves( self.dependents( name, transitive = True ) ):
 
-		( self.constructor, self.destructor ) = it.map( ( lambda number, iterable : dict( zip( range( number ), iterable ) ) ), ( ( numOfC, self.__constructorList ), ( numOfD, self.__destructorList ) ) )
+			for ( dependent, formed ) in zip( wave, pool.map( reformName, wave ) ):
 
-		for t in self.constructor:
+				self.__store( dependent, formed )
 
-			self.constructor[ self.constructor[ t ] ] = ( lambda args : self.__destructorList[ t ][ 1 ].constructor( self.__typeMap( self.__constructorList[ t ][ 1 ].constructor, self.__constructorList[ t ][ 1 ].destructor, args ) ) )
+	####################################################################
+
+	def remove( self, name, cascade = False ):
+		"""Removes and returns the type named `name`
+
+		Raises a KeyError if there is no such type, and a ValueError if
+		other types were formed from it, unless `cascade`, in which case
+		those are all removed as well
+		"""
+
+		dependents = self.dependents( name, transitive = True )
+
+		if( dependents and ( not cascade ) ):
+
+			raise( ValueError( "The types " + repr( sorted( dependents ) ) + " depend on " + repr( name ) ) )
+
+		formed = self.__types.pop( name )
+
+		for removed in [ name ] + sorted( dependents ):
+
+			if( removed != name ):
+				self.__types.pop( removed )
+
+			del self.__names[ bisect.bisect_left( self.__names, removed ) ]
+
+			self.__unindex( removed )
+
+			self.__unlink( removed )
+
+			self.__dependents.pop( removed, None )
+
+		return formed
+
+	####################################################################
+
+	def range( self, start = None, stop = None ):
+		"""Returns the names from `start` up to, but excluding, `stop`
+
+		Either end may be None, in which case the range is unbounded
+		"""
+
+		low = 0 if ( start is None ) else bisect.bisect_left( self.__names, start )
+
+		high = len( self.__names ) if ( stop is None ) else bisect.bisect_left( self.__names, stop )
+
+		return self.__names[ low : max( low, high ) ]
+
+	####################################################################
+
+	def prefix( self, prefix ):
+		"""Returns the names starting with `prefix`, in order"""
+
+		low = bisect.bisect_left( self.__names, prefix )
+
+		# Every name with `prefix` sorts before `prefix` followed by the
+		# greatest code point
+		return self.__names[ low : bisect.bisect_left( self.__names, prefix + "\U0010ffff", low ) ]
+
+	####################################################################
+
+	def complete( self, prefix ):
+		"""Returns the longest completion shared by every name of `prefix`
+
+		As the names are sorted, this is the common prefix of only the
+		first and last of them; `prefix` is returned if none match
+		"""
+
+		low = bisect.bisect_left( self.__names, prefix )
+
+		high = bisect.bisect_left( self.__names, prefix + "\U0010ffff", low )
+
+		if( low == high ):
+			return prefix
 
-		for t in self.destructor:
+		return os.path.commonprefix( [ self.__names[ low ], self.__names[ high - 1 ] ] )
 
-			self.destructor[ self.destructor[ t ] ] = ( lambda args : self.__destructorList[ t ][ 1 ]( args ) )
+	####################################################################
 
-		self.__worker = self.constructor
+	def where( self, indexName, key ):
+		"""Returns the names whose `indexName` key is `key`, in order"""
 
-    ####################################################################
+		return sorted( self.__indexes[ indexName ].get( key, () ) )
 
 ########################################################################
 
-class TypeFormer( TypeWorker ):
-	"""TypeWorker derived class which holds Type formation info
+# The secondary indexes of every TypeAssistant's registry, by the labels
+# of each formed type's constructor and destructor type lists
+typeIndexes = {
+	"constructor" : ( lambda formed : tuple( formed[ 1 ].constructorIndex ) ),
+	"destructor" : ( lambda formed : tuple( formed[ 1 ].destructorIndex ) ),
+	}
 
-	A worker responsible for turning representations of types into the
-	type that is being represented
+########################################################################
+
+def parseTypeList( text ):
+	"""Returns the type list written as `text`
+
+	`text` is `label=Type` pairs seperated by commas, where each Type is
+	the name of a registered type; a ValueError is raised if any pair
+	has no `=`
 	"""
 
-	def __initWorker( self, formation ):
-		"""Derived method for creating __worker
+	typeList = []
 
-		`formation` must be a triple containing a 'Structure'
-		function, `typeMap`, a 'Constructor TypeList' `constructorTypes`, 
-		and a 'Destructor TypeList' `destructorTypes`
-		"""
-		
-		structor = ( lambda constructorArgs : TypeStructor( formation, constructorArgs ) )
+	for pair in filter( None, text.split( "," ) ):
 
-		return ( lambda name : np.array( ( name, structor ) ) )
-			
+		( label, separator, name ) = pair.partition( "=" )
+
+		if( not separator ):
+
+			raise( ValueError( "Expected label=Type, not " + repr( pair ) ) )
+
+		typeList.append( ( label.strip(), name.strip() ) )
+
+	return typeList
 
 ########################################################################
 
-class TypeChecker:
-	"""Enables automatic TypeChecking and Error Reports
+def destructThrough( constructor, destructor, args ):
+	"""The typeMap of the Types formed by `TypeAssistant.create`
 
-	TODO
+	`args` are destructed by the source structor, and passed on as they
+	are to the constructor of the target
 	"""
 
-	def __initWorker( self, workers ):
-		"""
+	return destructor( args )
 
-		"""
+########################################################################
+
+class PrimitiveStructor:
+	"""The structor of a builtin answer type, to form other Types from
+
+	Constructing and destructing -- as calling does -- both coerce
+	`args` to `type`, so it stands in a type list as an entry would
+	"""
+
+	__slots__ = ( "type", )
+
+	def __init__( self, answerType ):
+
+		self.type = answerType
 
+	def constructor( self, args ):
+
+		return self.type( args )
+
+	( destructor, __call__ ) = ( constructor, constructor )
+
+# The answer types registered as Types in a new TypeAssistant's registry
+primitiveTypes = ( "int", "float", "complex", "bool", "str" )
+
+########################################################################
+
+def primitiveRegistry():
+	"""Returns a new `TypeRegistry` holding only the `primitiveTypes`
+
+	Each is formed from a `PrimitiveStructor` alone, so that the Types
+	created by a TypeAssistant have registered Types to be formed from
+	"""
+
+	registry = TypeRegistry( typeIndexes )
+
+	for name in primitiveTypes:
+
+		structor = PrimitiveStructor( resolveAnswerType( name ) )
+
+		registry.register( name, formType( name, ( destructThrough, [ ( "value", structor ) ], [ ( "value", structor ) ] ) ) )
+
+	return registry
 
 ########################################################################
 
 class TypeAssistant:
 	"""Enables user management of Types via user real-time input
 
-	TODO
+	Alternatively, a `script` of commands can be given, in which case
+	they are all run without prompting -- see `runScript`
 	"""
 
-	def __init__( self, verbose = True ):
+	# The public methods which can be given as commands
+	commands = ( "create", "edit", "delete", "export" )
+
+	def __init__( self, verbose = True, script = None, types = None ):
 
-		self.__workers = mp.Pool()
+		# The shared pool only starts once work is dispatched to it
+		self.__workers = workerPool
 
-		self.__types = {}
+		# Re-forming dependents shares their structors' functions, so it
+		# needs a pool sharing memory -- which also starts only once used
+		self.__formers = SharedPool( backend = "thread" )
+
+		# The types to manage, which may be an existing `TypeRegistry`
+		self.__types = primitiveRegistry() if ( types is None ) else types
 
 		self.__exit = False
 
 		if ( verbose ):
 
 			# We greet the user and introduce the TypeAssistant
-			helloMessage()
+			self.helloMessage()
 
 			# We display the options available 
-			displayMethods()
+			self.displayMethods()
+
+		# A script is run straight through, without an event loop
+		if( script is not None ):
+
+			self.runScript( script )
+
+		# Otherwise, we begin the life-cycle loop of our TypeAssistant
+		else:
+
+			asyncio.run( self.__lifeCycle() )
+
+	####################################################################
+
+	@property
+	def types( self ):
+		"""The `TypeRegistry` of the types this TypeAssistant manages"""
+
+		return self.__types
+
+	####################################################################
+
+	def runScript( self, script ):
+		"""Runs every command in `script` without prompting
+
+		`script` is a file-like object -- such as `sys.stdin` -- read by
+		`readCommands`; each command's answers are passed along as its
+		`manual`, so they are validated by `askUserRTI` rather than
+		asked for -- an answer that is invalid, or missing, raises. The
+		throughput is reported at the end, and the number of commands
+		run and the commands per second are returned
+		"""
+
+		( count, start ) = ( 0, time.perf_counter() )
+
+		for ( name, answers ) in readCommands( script ):
+
+			if( name == "exit" ):
+				break
+
+			if( name not in TypeAssistant.commands ):
 
-		# We begin the life-cycle loop of our TypeAssistant
-		while( not __exit ):
+				raise( ValueError( "Unknown command: " + name ) )
 
-			__workers.map( __interpret, __awaitInput() )
+			getattr( self, name )( iter( answers ) )
+
+			count += 1
+
+		elapsed = time.perf_counter() - start
+
+		throughput = ( count / elapsed ) if elapsed else float( "inf" )
+
+		print( "|| Ran " + str( count ) + " command(s) in " + format( elapsed, ".3f" ) + "s ( " + format( throughput, ".1f" ) + " commands/sec )" )
+
+		return ( count, throughput )
+
+	####################################################################
+
+	# The methods which may run for a long time, and so are run in an
+	# executor rather than on the event loop itself -- but only when all
+	# of their answers were given, as otherwise they read from stdin
+	heavyMethods = ( "create", "export" )
+
+	####################################################################
+
+	async def __lifeCycle( self ):
+		"""The event loop driving the life-cycle of our TypeAssistant
+
+		Reading input and interpreting each command are separate tasks,
+		so the prompt is back as soon as a command has been dispatched
+		and several commands can be running at once
+		"""
+
+		tasks = set()
+
+		while( not self.__exit ):
+
+			command = await self.__awaitInput()
+
+			task = asyncio.create_task( self.__interpret( command ) )
+
+			# We hold on to every running task until it is done
+			tasks.add( task )
+
+			task.add_done_callback( tasks.discard )
+
+			# We let the new task start before prompting again, so an
+			# `exit` is seen by the loop
+			await asyncio.sleep( 0 )
+
+		await asyncio.gather( *tasks )
 
 	####################################################################
 
@@ -122,45 +1272,183 @@ class TypeAssistant:
 
 	####################################################################
 
-	def __awaitInput( self ):
+	async def __awaitInput( self ):
+		"""Waits for the next command without blocking the event loop
 
-		# TODO
-		print( "Await Input!" )
+		The blocking `input` is run in the default executor; the end
+		of input is treated as an `exit` command
+		"""
+
+		def readCommand():
+
+			try:
+				return input( "\\\\>>>\t" )
+			except EOFError:
+				return "exit"
+
+		return await asyncio.get_running_loop().run_in_executor( None, readCommand )
 
 	####################################################################
 
-	def __interpret( self, input ):
+	async def __interpret( self, input ):
+		"""Dispatches a command to the matching public method
 
-		# TODO
-		print( "Interpret!" )
+		The first word of `input` names the method, and the rest -- if
+		any -- is passed along as `manual`, an iterator of its words;
+		methods in `heavyMethods` given a `manual` are run in an
+		executor, while a method left to ask its questions runs on the
+		loop, so no command is read until they have been answered
+		"""
+
+		( name, _, rest ) = input.strip().partition( " " )
+
+		# Without any answers, the method asks for them instead
+		manual = iter( rest.split() ) if rest.strip() else None
+
+		if( name == "exit" ):
+
+			self.__exit = True
+
+		elif( name in TypeAssistant.commands ):
+
+			method = getattr( self, name )
+
+			# A command given an unknown type, or malformed answers, is
+			# reported rather than ending the life-cycle
+			try:
+
+				# We never offload a method which will ask for its
+				# answers, as the prompt would then read stdin too
+				if( ( name in TypeAssistant.heavyMethods ) and ( manual is not None ) ):
+
+					await asyncio.get_running_loop().run_in_executor( None, method, manual )
+
+				else:
+
+					method( manual )
+
+			except ( KeyError, ValueError ) as e:
+
+				print( "|| " + str( e.args[ 0 ] if e.args else e ) )
+
+		elif( name ):
+
+			print( "|| Unknown command: " + name )
+
+	####################################################################
+
+	def ask( self, question, answerTypeName, answerLimits = None, manual = None ):
+		"""Asks `question` through `askUserRTI`, for a command
+
+		`manual` is the iterator of answers given to the command, if
+		any, in which case the next of them is used instead of asking
+		"""
+
+		return askUserRTI( question, answerTypeName, answerLimits, manual )
+
+	####################################################################
+
+	def __askTypeLists( self, manual ):
+		"""Asks for the constructor and destructor type lists of a Type
+
+		A ValueError is raised unless both lists are the same length,
+		as each constructor is paired with the destructor at its index
+		"""
+
+		typeLists = [ 
+			parseTypeList( self.ask( "What are the " + kind + " Types, as label=Type pairs seperated by commas?", "str", manual = manual ) ) 
+			for kind in ( "Constructor", "Destructor" ) 
+			]
+
+		if( len( typeLists[ 0 ] ) != len( typeLists[ 1 ] ) ):
+
+			raise( ValueError( "Expected as many Destructor Types as Constructor Types, not " + str( len( typeLists[ 1 ] ) ) + " and " + str( len( typeLists[ 0 ] ) ) ) )
+
+		return typeLists
 
 	####################################################################
 
 	def create( self, manual = None ):
+		"""Forms a new Type from the type lists of registered Types
 
-		# TODO
-		print( "Create a Type!" )
+		The new Type maps between them by `destructThrough`; the
+		`primitiveTypes` are registered from the start to form from
+		"""
+
+		name = self.ask( "What is the name of the new Type?", "str", manual = manual )
+
+		if( name in self.__types ):
+
+			raise( KeyError( "There is already a Type named " + repr( name ) + "; edit it instead" ) )
+
+		self.__types.form( name, ( destructThrough, *self.__askTypeLists( manual ) ), self.__formers )
+
+		print( "|| Created " + name )
 
 	####################################################################
 
 	def edit( self, manual = None ):
+		"""Gives a Type new type lists, keeping its typeMap
 
-		# TODO
-		print( "Edit a Type!" )
+		Only Types formed from a blueprint can be edited; every Type
+		formed from the edited one is re-formed, those of each wave
+		together on a pool of threads
+		"""
+
+		name = self.ask( "What is the name of the Type to edit?", "str", manual = manual )
+
+		blueprint = self.__types.blueprint( name )
+
+		if( blueprint is None ):
+
+			raise( KeyError( "There is no Type named " + repr( name ) + " formed from a blueprint" ) )
+
+		typeLists = self.__askTypeLists( manual )
+
+		dependents = self.__types.dependents( name, transitive = True )
+
+		self.__types.form( name, ( blueprint[ 0 ], *typeLists ), self.__formers )
+
+		print( "|| Edited " + name + ", and re-formed " + str( len( dependents ) ) + " Type(s) formed from it" )
 
 	####################################################################
 
 	def delete( self, manual = None ):
+		"""Deletes a Type, along with every Type formed from it
 
-		# TODO
-		print( "Delete a Type!" )
+		The Types formed from it are only deleted once confirmed
+		"""
+
+		name = self.ask( "What is the name of the Type to delete?", "str", manual = manual )
+
+		if( name not in self.__types ):
+
+			raise( KeyError( "There is no Type named " + repr( name ) ) )
+
+		dependents = self.__types.dependents( name, transitive = True )
+
+		if( dependents ):
+
+			question = str( len( dependents ) ) + " Type(s) are formed from " + name + "; delete them too? ( 1 for yes, 0 for no )"
+
+			if( not self.ask( question, "int", [ DomainMask( [ 0, 1 ] ) ], manual = manual ) ):
+
+				print( "|| Kept " + name )
+
+				return
+
+		self.__types.remove( name, cascade = True )
+
+		print( "|| Deleted " + name + ( ( " and " + ", ".join( sorted( dependents ) ) ) if dependents else "" ) )
 
 	####################################################################
 
 	def export( self, manual = None ):
 
+		name = self.ask( "What is the name of the Type to export?", "str", manual = manual )
+
 		# TODO
-		print( "Export a Type!" )
+		print( "Export a Type!", name )
 
 ########################################################################
 
@@ -175,6 +1463,22 @@ def main():
 	later ( pickling )
 	"""
 
+	# A script given as the first argument -- or `-` for stdin -- is
+	# run in batch mode
+	if( len( sys.argv ) > 1 ):
+
+		if( sys.argv[ 1 ] == "-" ):
+
+			TypeAssistant( verbose = False, script = sys.stdin )
+
+		else:
+
+			with open( sys.argv[ 1 ] ) as script:
+
+				TypeAssistant( verbose = False, script = script )
+
+		return
+
 	# TODO
 	print( "Main!" )
 	answer = askUserRTI( "How many?", 'int' )
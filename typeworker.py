@@ -1,8 +1,15 @@
 import itertools as it
+import atexit
+import collections as co
+import functools as ft
+import importlib
+import threading
+import time
+import types
 
-import multiprocessing as mp
 from abc import ABC, abstractmethod
-import numpy as np
+
+from unclassed import LRUCache, limitValidatorCache, np, mp
 
 #######################################################################
 
@@ -23,80 +30,523 @@ def applyString( func, args ):
 
 #######################################################################
 
+def extract( info ):
+
+	return  ( info[ 0 ], info[ 1 : ] ) if ( info != None ) else ( None, None )
 
-#def extract( info ):
+#######################################################################
 
-#	return  ( info[ 0 ], info[ 1 : ] ) if ( info != None ) else ( None, None )
+def changed( current, new ):
+	"""Returns whether `new` differs from `current`
+
+	Values -- like arrays -- whose comparison has no single truth
+	value are treated as changed unless they are the same object
+	"""
+
+	if( current is new ):
+		return False
+
+	try:
+		return bool( current != new )
+	except ValueError:
+		return True
 
 #######################################################################
 
-def swapStringGen( a, b ):
+class TypeProperty:
+	"""Data descriptor for a property which tracks its old value
+
+	Replaces the properties that were once generated as source and
+	`exec`-ed for every instance; one descriptor is made per property
+	when the class is defined, so construction never compiles code.
+	The current and old values live in the slots named by `typeSlots`,
+	and the init flag is one bit of the shared `_propertyInits` slot
+	"""
+
+	def __set_name__( self, owner, name ):
+
+		( self.name, Name ) = ( name, name[ 0 ].upper() + name[ 1 : ] )
+
+		( self.attr, self.oldAttr ) = ( "_" + name, "_old" + Name )
+
+		# Each property of a class -- and of its bases -- gets its own
+		# bit of `_propertyInits`
+		count = getattr( owner, "typePropertyCount", 0 )
+
+		( self.bit, owner.typePropertyCount ) = ( 1 << count, count + 1 )
+
+	####################################################################
+
+	def __get__( self, instance, owner = None ):
+
+		if( instance is None ):
+			return self
+
+		return getattr( instance, self.attr, None )
+
+	####################################################################
+
+	def __set__( self, instance, new ):
+
+		inits = getattr( instance, "_propertyInits", 0 )
+
+		if( inits & self.bit ):
+
+			( old, current ) = ( getattr( instance, self.attr, None ), new )
+
+			setattr( instance, self.oldAttr, old )
+
+			setattr( instance, self.attr, current )
+
+			inits = ( inits | self.bit ) if ( ( old is not None ) or ( current is not None ) ) else ( inits & ~self.bit )
+
+		elif( changed( getattr( instance, self.attr, None ), new ) ):
+
+			setattr( instance, self.attr, new )
+
+			inits |= self.bit
+
+		instance._propertyInits = inits
+
+	####################################################################
+
+	def __delete__( self, instance ):
 
-	swapTup, indexCycle = ( str( a ), str( b ) ), it.cycle( range( 2 ) )
+		delattr( instance, self.attr )
 
-	swapper = ( swapTup[ i ] for i in indexCycle )
+		setattr( instance, self.oldAttr, None )
 
-	return ( "{x}, {y} = {y}, {x}".format( x = next(swapper), y = next(swapper) ) )
+		instance._propertyInits = getattr( instance, "_propertyInits", 0 ) & ~self.bit
+
+	####################################################################
+
+	def old( self, instance ):
+		"""Returns the value `instance` held before its current one"""
+
+		return getattr( instance, self.oldAttr, None )
 
 #######################################################################
 
-def typeProperty( name ):
+def typeSlots( *names ):
+	"""Returns the `__slots__` needed by `TypeProperty`s named `names`
 
-	base = "\n".join( ( "{decorator}", "def {name}( {args} ):", "{body}" ) )
+	A slotted class must list these for each of its own TypeProperty
+	descriptors, along with the `_propertyInits` slot once per
+	hierarchy
+	"""
 
-	stringTups = zip( (
-		( "@property", "@{name}.setter", "@{name}.deleter" ),
-		( "self", "self, new{Name}", "self" ),
-		(
-		"""
-		return self._{name}
-		""", 
-		"""	
-		if ( self.__{name}Init ):
+	return tuple( it.chain.from_iterable( 
+		( "_" + name, "_old" + name[ 0 ].upper() + name[ 1 : ] ) for name in names 
+		) )
+
+#######################################################################
+
+# Marks a miss when looking up the `history` of a TypeMethod
+noEntry = object()
+
+#######################################################################
+
+def infoKey( form, data ):
+	"""Returns `( form, data )` as a key of `history`, if hashable
+
+	Infos which cannot be hashed are simply never kept, so None is
+	returned for them instead
+	"""
+
+	try:
+
+		key = ( form, data )
+
+		hash( key )
 
-			self.__old{Name}, self._{name} = self._{name}, new{Name}
+	except TypeError:
 
-			self.__{name}Init = True if ( ( self.__old{Name} != None ) or ( self._{name} != None ) ) else False
+		return None
 
-		elif ( self.{name} != new{Name} ):
+	return key
+
+#######################################################################
+
+class InlinePool:
+	"""A stand-in for `multiprocessing.Pool` which runs work in-line
+
+	Used by the "inline" backend of `SharedPool`, where the overhead
+	of another thread or process is not worth paying
+	"""
+
+	class Result:
+
+		def __init__( self, func, args = (), kwds = {} ):
+
+			try:
+
+				( self.__value, self.__success ) = ( func( *args, **kwds ), True )
+
+			except Exception as e:
+
+				( self.__value, self.__success ) = ( e, False )
+
+		def get( self, timeout = None ):
+
+			if( not self.__success ):
+				raise( self.__value )
+
+			return self.__value
+
+		def wait( self, timeout = None ):
+
+			pass
 
-			self._{name} = new{Name}
+		def ready( self ):
 
-			self.__{name}Init = True
-		""", 
+			return True
+
+		def successful( self ):
+
+			return self.__success
+
+	def apply( self, func, args = (), kwds = {} ):
+
+		return func( *args, **kwds )
+
+	def apply_async( self, func, args = (), kwds = {} ):
+
+		return InlinePool.Result( func, args, kwds )
+
+	def map( self, func, iterable, chunksize = None ):
+
+		return list( map( func, iterable ) )
+
+	def map_async( self, func, iterable, chunksize = None ):
+
+		return InlinePool.Result( self.map, ( func, iterable ) )
+
+	def starmap( self, func, iterable, chunksize = None ):
+
+		return list( it.starmap( func, iterable ) )
+
+	def imap( self, func, iterable, chunksize = 1 ):
+
+		return map( func, iterable )
+
+	imap_unordered = imap
+
+	def close( self ):
+
+		pass
+
+	def terminate( self ):
+
+		pass
+
+	def join( self ):
+
+		pass
+
+#######################################################################
+
+class SharedPool:
+	"""A lazily started pool of workers, shared by everything using it
+
+	Nothing is started until the pool is first used, at which point a
+	pool of `size` workers -- or one per core if `size` is None -- is
+	made using `backend`, which is one of "process", "thread", or
+	"inline"; the pool can be reconfigured, and -- once started --
+	is shut down on exit
+	"""
+
+	backends = {
+		"process" : ( lambda size : mp.Pool( size ) ),
+		"thread" : ( lambda size : importlib.import_module( "multiprocessing.pool" ).ThreadPool( size ) ),
+		"inline" : ( lambda size : InlinePool() ),
+		}
+
+	def __init__( self, size = None, backend = "process" ):
+
+		self.__lock = threading.Lock()
+
+		self.__pool = None
+
+		self.configure( size, backend )
+
+	####################################################################
+
+	def configure( self, size = None, backend = "process" ):
+		"""Sets the `size` and `backend` of the pool
+
+		A pool which has already started is shut down, so that the
+		next use starts one with the new configuration
 		"""
-		del self._{name}
 
-		del self.__old{Name}
+		if( backend not in SharedPool.backends ):
+
+			raise( ValueError( "The backend must be one of: " + ", ".join( SharedPool.backends ) ) )
+
+		self.shutdown()
+
+		( self.size, self.backend ) = ( size, backend )
+
+	####################################################################
+
+	@property
+	def started( self ):
+
+		return ( self.__pool is not None )
+
+	####################################################################
+
+	def get( self ):
+		"""Returns the pool, starting it if this is its first use"""
+
+		if( self.__pool is None ):
+
+			with self.__lock:
+
+				if( self.__pool is None ):
+
+					self.__pool = SharedPool.backends[ self.backend ]( self.size )
+
+					# Every started pool -- not only `workerPool` -- is
+					# shut down on exit, unless it is shut down first
+					atexit.register( self.shutdown )
+
+		return self.__pool
+
+	####################################################################
+
+	def __getattr__( self, name ):
+
+		# Private attributes are never delegated, as they are looked up
+		# before `__init__` when unpickling
+		if( name.startswith( "_" ) ):
+			raise( AttributeError( name ) )
+
+		# Any other attribute -- `map`, `apply_async`, and so on -- is
+		# looked up on the started pool
+		return getattr( self.get(), name )
+
+	####################################################################
+
+	def queueDepth( self ):
+		"""Returns the number of tasks waiting for the pool's workers"""
+
+		taskQueue = getattr( self.__pool, "_taskqueue", None )
+
+		return taskQueue.qsize() if ( taskQueue is not None ) else 0
+
+	####################################################################
+
+	def state( self ):
+		"""Returns the configuration of the pool and how busy it is"""
+
+		return { "started" : self.started, "backend" : self.backend, "size" : self.size, "queueDepth" : self.queueDepth() }
 
-		self.__{name}Init = False
-		""",
-		) ) )
+	####################################################################
+
+	def shutdown( self ):
+		"""Closes the pool and waits for its workers, if it started"""
+
+		with self.__lock:
+
+			( pool, self.__pool ) = ( self.__pool, None )
+
+		if( pool is not None ):
+
+			atexit.unregister( self.shutdown )
+
+			pool.close()
+
+			pool.join()
+
+#######################################################################
+
+# The one pool shared by every TypeWorker and the TypeAssistant
+workerPool = SharedPool()
+
+#######################################################################
+
+class Timing:
+	"""The call count, cumulative time, and recent latencies of a call
+
+	Only the latest `window` latencies are kept, from which the
+	percentiles are computed
+	"""
+
+	__slots__ = ( "count", "total", "latencies" )
+
+	def __init__( self, window = 1024 ):
+
+		( self.count, self.total, self.latencies ) = ( 0, 0.0, co.deque( maxlen = window ) )
+
+	####################################################################
+
+	def record( self, latency ):
+
+		self.count += 1
+
+		self.total += latency
+
+		self.latencies.append( latency )
+
+	####################################################################
+
+	def snapshot( self, quantiles = ( 0.5, 0.9, 0.99 ) ):
+
+		percentiles = np.quantile( self.latencies, quantiles ) if self.latencies else [ 0.0 ] * len( quantiles )
+
+		return { 
+			"count" : self.count, 
+			"total" : self.total, 
+			"quantiles" : dict( zip( map( str, quantiles ), map( float, percentiles ) ) ) 
+			}
+
+#######################################################################
+
+class Instruments:
+	"""Timings and counters for TypeWorkers and TypeMethod.update
+
+	Nothing is recorded unless `enabled`, in which case every call of
+	an `instrumented` method is timed under its name; caches given to
+	`watch` have their statistics reported along with the depth of the
+	queue of `pool`
+	"""
 
+	def __init__( self, pool, enabled = False ):
 
-	swapdateBody = """
-		swapdater = swapStringGen( ( self.form, self.data, self.process ), ( self.__oldForm, self.__oldData, self.__oldProcess ) ) 
-		
-		while( True ):
+		( self.pool, self.enabled ) = ( pool, enabled )
 
-			yield exec( next( swapdater ) )
+		( self.timings, self.counters, self.caches ) = ( co.defaultdict( Timing ), co.Counter(), {} )
+
+	####################################################################
+
+	def time( self, name, latency ):
+
+		self.timings[ name ].record( latency )
+
+	####################################################################
+
+	def count( self, name, amount = 1 ):
+
+		self.counters[ name ] += amount
+
+	####################################################################
+
+	def watch( self, name, cache ):
+		"""Reports the `stats` of the LRUCache `cache` under `name`"""
+
+		self.caches[ name ] = cache
+
+	####################################################################
+
+	def reset( self ):
+
+		self.timings.clear()
+
+		self.counters.clear()
+
+	####################################################################
+
+	def snapshot( self, prefix = "" ):
+		"""Returns every timing, counter, and cache statistic as a dict
+
+		Only the timings and counters whose names start with `prefix`
+		are included
 		"""
 
-	swapdateString = base.format( decorator = decorator, name = "swapdate", args = "self" body = swapdateBody )
+		return {
+			"timings" : { name : timing.snapshot() for ( name, timing ) in self.timings.items() if name.startswith( prefix ) },
+			"counters" : { name : count for ( name, count ) in self.counters.items() if name.startswith( prefix ) },
+			"caches" : { name : cache.stats() for ( name, cache ) in self.caches.items() },
+			"pool" : self.pool.state(),
+			}
+
+	####################################################################
+
+	def prometheus( self ):
+		"""Returns the snapshot as Prometheus-style exposition text"""
+
+		snapshot = self.snapshot()
+
+		lines = [ "# TYPE typeworker_latency_seconds summary" ]
+
+		for ( name, timing ) in snapshot[ "timings" ].items():
+
+			lines.extend( 
+				'typeworker_latency_seconds{name="' + name + '",quantile="' + quantile + '"} ' + repr( value ) 
+				for ( quantile, value ) in timing[ "quantiles" ].items() 
+				)
+
+			lines.append( 'typeworker_latency_seconds_sum{name="' + name + '"} ' + repr( timing[ "total" ] ) )
+
+			lines.append( 'typeworker_latency_seconds_count{name="' + name + '"} ' + str( timing[ "count" ] ) )
+
+		lines.append( "# TYPE typeworker_events_total counter" )
+
+		lines.extend( 'typeworker_events_total{name="' + name + '"} ' + str( count ) for ( name, count ) in snapshot[ "counters" ].items() )
+
+		lines.append( "# TYPE typeworker_cache_hit_rate gauge" )
+
+		lines.extend( 'typeworker_cache_hit_rate{cache="' + name + '"} ' + repr( stats[ "hitRate" ] ) for ( name, stats ) in snapshot[ "caches" ].items() )
+
+		lines.append( "# TYPE typeworker_pool_queue_depth gauge" )
+
+		lines.append( "typeworker_pool_queue_depth " + str( snapshot[ "pool" ][ "queueDepth" ] ) )
+
+		return "\n".join( lines ) + "\n"
+
+#######################################################################
+
+# The instruments shared by every TypeWorker and TypeMethod
+instruments = Instruments( workerPool )
+
+instruments.watch( "limitValidators", limitValidatorCache )
+
+#######################################################################
+
+def instrumented( func, name = None ):
+	"""Wraps the method `func` so that -- if enabled -- it is timed
+
+	Calls are timed under `name`, or else the qualified name of the
+	instance's class and of `func`; when `instruments` is disabled the
+	only overhead is a single check
+	"""
+
+	@ft.wraps( func )
+	def wrapper( self, *args, **kwargs ):
+
+		if( not instruments.enabled ):
+			return func( self, *args, **kwargs )
+
+		start = time.perf_counter()
+
+		try:
+			return func( self, *args, **kwargs )
+		finally:
+			instruments.time( name or ( type( self ).__qualname__ + "." + func.__name__ ), time.perf_counter() - start )
+
+	return wrapper
 
-	return [  base.format( decorator = decorator, name = name, Name = name.capitalize(), args =  args, body = body ) for ( decorator, args, body ) in stringTups ]
 
 #######################################################################
 
 class TypeMethod( ABC ):
 
-	def __init__( self, info = None ):
+	# Derived classes should define `__slots__` too, even if empty,
+	# so that their instances have no `__dict__`
+	__slots__ = typeSlots( "form", "data", "process" ) + ( "_propertyInits", "history", "__initialized" )
 
-		self.__properties = []
+	( form, data, process ) = ( TypeProperty(), TypeProperty(), TypeProperty() )
 
-		( self.__dataInit, self.__processInit ) = ( False, False )
+	# The default number of recent processes kept in `history`
+	historySize = 8
 
-		[ exec( typeProperty( name ) ) for name in ( "data", "process" ) ]
+	def __init__( self, info = None, historySize = None ):
+
+		# Unless sized explicitly, `history` is only made once there is
+		# a process to keep, which many instances never have
+		self.history = None if ( historySize is None ) else LRUCache( historySize )
+
+		self.__initialized = False
 
 		self.update( info )
 
@@ -115,28 +565,61 @@ class TypeMethod( ABC ):
 
 	####################################################################
 
+	@instrumented
 	def update( self, newInfo ):
 		"""Public method for updating process
 
 		Uses newInfo to update form, data, and -- using 
-		those -- process
+		those -- process; a process for any of the recent infos kept
+		in `history` is reused, rather than calling init again
 		"""
 
 		( newForm, newData ) = extract( newInfo )
 
-		( currMatch, oldMatch ) = [ ( match == ( newForm, newData ) ) for match in ( ( self.form, self.data ), ( self.__oldForm, self.__oldData ) ) ]
+		# Data may hold arrays, whose `==` has no single truth value
+		if( not ( changed( self.form, newForm ) or changed( self.data, newData ) ) ):
+			return
+
+		key = infoKey( newForm, newData )
+
+		process = noEntry if ( ( key is None ) or ( self.history is None ) ) else self.history.get( key, noEntry )
+
+		if( instruments.enabled ):
 
-		if( not ( currMatch or oldMatch ) ):
+			instruments.count( type( self ).__qualname__ + ".history." + ( "misses" if ( process is noEntry ) else "hits" ) )
 
-			( self.form, self.data ) = ( newForm, newData )
+		if( process is noEntry ):
 
-			self.process = init( self.form, self.data )
+			process = self.init( newForm, newData )
 
-			self.__initialized = True
+		# The current process is kept in `history` before it is replaced
+		currentKey = infoKey( self.form, self.data ) if self.__initialized else None
 
-		elif( oldMatch ): 
+		if( currentKey is not None ):
 
-			self.swapdate()
+			if( self.history is None ):
+				self.history = LRUCache( self.historySize )
+
+			self.history.put( currentKey, self.process )
+
+		( self.form, self.data, self.process ) = ( newForm, newData, process )
+
+		self.__initialized = True
+
+	####################################################################
+
+	def swapdate( self ):
+		"""Public method for swapping back to the old process
+
+		Updates to the old form and data, which is a hit on `history`
+		unless the old process has since been evicted
+		"""
+
+		( oldForm, oldData ) = ( TypeMethod.form.old( self ), TypeMethod.data.old( self ) )
+
+		if( oldData is not None ):
+
+			self.update( ( oldForm, ) + tuple( oldData ) )
 
 
 ########################################################################
@@ -150,65 +633,127 @@ class TypeWorker( ABC ):
 
 	class WorkerPool( TypeMethod ):
 
+		__slots__ = ()
+
 		@staticmethod
 		def init( form, data ):
 
-			return Pool() if ( form == 0 ) else apply( Pool, data )
+			return workerPool if ( form == 0 ) else SharedPool( *data )
 
 	class Worker( TypeMethod ):
 
+		__slots__ = ()
+
 		@staticmethod
 		@abstractmethod
 		def init( form, data ):
 
 			pass
 
+	__slots__ = typeSlots( "pool", "worker" ) + ( "_propertyInits", "form", "poolInfo", "workerInfo" )
+
+	( pool, worker ) = ( TypeProperty(), TypeProperty() )
+
+	def __init_subclass__( cls, **kwargs ):
+		"""Instruments the public methods of every derived TypeWorker
+
+		Each is timed under the name of the derived class and method
+		"""
+
+		super().__init_subclass__( **kwargs )
+
+		for ( name, attribute ) in list( vars( cls ).items() ):
+
+			if( isinstance( attribute, types.FunctionType ) and ( not name.startswith( "_" ) ) ):
+
+				setattr( cls, name, instrumented( attribute, cls.__qualname__ + "." + name ) )
+
+	####################################################################
+
 	def __init__( self, info, args ):
 		"""Initialization for TypeWorker derived classes
 
 		Creates `worker` using `info` before calling the `work` method
 		"""
-		
-		[ exec( typeProperty( name ) ) for name in ( "pool", "worker" ) ]
 
 		( self.form, self.poolInfo, self.workerInfo ) = info
 
-		self.update()
+		# Without any `poolInfo` the worker uses the shared pool
+		self.pool = TypeWorker.WorkerPool( ( 0, ) if ( self.poolInfo is None ) else self.poolInfo ).process
+
+		self.worker = self.initWorker( self.workerInfo )
 
 		self.work( args )
 
 	####################################################################
 
-	@staticmethod
 	@abstractmethod
-	def __displayInfo( infoFormat, info ):
-		"""Abstract method for displaying 'info'
+	def initWorker( self, workerInfo ):
+		"""Abstract method for creating `worker` from `workerInfo`
 
 		Any derived TypeWorker must define this method and return
-		the selected info as a formatted string according to
-		infoFormat
+		its worker
+		"""
+
+		pass
+
+	####################################################################
+
+	def work( self, args ):
+		"""Method for starting work on `args`, once `worker` exists
+
+		Does nothing unless overridden by a derived TypeWorker
 		"""
 
 		pass
 
 	####################################################################
 
+	# The format used when displaying info
+	infoFormat = "{}"
+
+	@staticmethod
+	def displayInfo( infoFormat, info ):
+		"""Method for displaying 'info'
+
+		Returns the selected info as a formatted string according to
+		infoFormat; derived TypeWorkers may override this method
+		"""
+
+		return infoFormat.format( info )
+
+	####################################################################
+
 	def displayPoolInfo( self ):
 		"""Method for displaying poolInfo
 
-		Calls __display on poolInfo with infoFormat
+		Calls displayInfo on poolInfo with infoFormat, followed by the
+		state of this worker's own pool
 		"""
 
-		return __displayInfo( self.infoFormat, self.poolInfo )
+		return "\n".join( [ self.displayInfo( self.infoFormat, self.poolInfo ) ] + [ 
+			"{}: {}".format( name, value ) for ( name, value ) in self.pool.state().items() 
+			] )
 
 	####################################################################
 
 	def displayWorkerInfo( self ):
 		"""Method for displaying workerInfo
 
-		Calls __display on workerInfo with infoFormat
+		Calls displayInfo on workerInfo with infoFormat, followed by the
+		timings and counters recorded for this kind of worker
 		"""
 
-		return __displayInfo( self.infoFormat, self.workerInfo )
+		snapshot = instruments.snapshot( prefix = type( self ).__qualname__ + "." )
+
+		lines = [ self.displayInfo( self.infoFormat, self.workerInfo ) ]
+
+		for ( name, timing ) in snapshot[ "timings" ].items():
+
+			lines.append( "{}: {} call(s), {:.6f}s total, percentiles {}".format( name, timing[ "count" ], timing[ "total" ], timing[ "quantiles" ] ) )
+
+		lines.extend( "{}: {}".format( name, count ) for ( name, count ) in snapshot[ "counters" ].items() )
+
+		return "\n".join( lines )
 
 ########################################################################
\ No newline at end of file
@@ -1,7 +1,60 @@
-import numpy as np
 import functools as ft
+import collections as co
 import itertools as it
-import multiprocessing as mp
+import importlib
+import numbers
+import operator
+import random
+import bisect
+import builtins
+import sys
+from abc import ABC, abstractmethod
+
+########################################################################
+
+class LazyModule:
+	"""A stand-in for the module `name`, imported on first use
+
+	The first attribute looked up imports the module and copies its
+	namespace onto the stand-in, so later look-ups are as cheap as
+	they are on the module itself
+	"""
+
+	def __init__( self, name ):
+
+		self.__name = name
+
+	def __getattr__( self, attribute ):
+
+		module = importlib.import_module( self.__name )
+
+		vars( self ).update( vars( module ) )
+
+		return getattr( module, attribute )
+
+	def __repr__( self ):
+
+		return "<LazyModule " + repr( self.__name ) + ">"
+
+########################################################################
+
+# The stand-ins for every costly module used by this module and those
+# built on it, which import them from here; each is only imported once
+# it is first used, so that importing any of them stays cheap
+( np, mp, asyncio, inspect, json ) = ( 
+	LazyModule( "numpy" ), LazyModule( "multiprocessing" ), LazyModule( "asyncio" ), LazyModule( "inspect" ), LazyModule( "json" ) 
+	)
+
+########################################################################
+
+def isNumpyType( oiqType ):
+	"""Subroutine that checks if `oiqType` is a numpy scalar type
+
+	Nothing can be a numpy type unless numpy has been imported, so
+	this never imports numpy itself
+	"""
+
+	return ( "numpy" in sys.modules ) and issubclass( oiqType, sys.modules[ "numpy" ].generic )
 
 ########################################################################
 
@@ -35,78 +88,273 @@ def reIndex( index, reiterable ):
 
 ########################################################################
 
-def autoFormat( collection, selection, pre="", sep="", end="" ):
-	"""A subroutine for constructing complex strings 
+def autoFormatChunks( collection, selection, pre="", sep="", end="" ):
+	"""A generator yielding the chunks of an `autoFormat` string in order
 
-	Uses a boolean-array, `selection`, as a slice on the provided array,
-	`collection`. A complex formatted string is then formatted, which 
-	begins with `pre`, ends with `end`, and has exactly the 'elements'
-	in our slice, each seperated by `sep`
+	Lazily walks the 'elements' of `collection` picked out by the 
+	boolean-array, `selection`, yielding `pre`, then each element
+	followed by -- or, for a string `sep`, seperated by -- its `sep`,
+	and finally `end`
 	"""
 
 	sepType = type( sep )
 
+	# The selection is walked lazily, rather than being sliced out
+	selected = it.compress( collection, selection )
 
 	# If we have a simple string seperator
 	if( sepType == type( '' ) ):
 
-		return pre + sep.join( collection[ selection ] ) + end
+		yield pre
+
+		for ( index, element ) in enumerate( selected ):
+
+			if( index ):
+				yield sep
+
+			yield str( element )
 
 	# If we have a list or tuple of seperators
 	elif( sepType in ( type( [] ), type( () ) ) ):
 
-		# We get the selection from collection so we can index
-		# into it in our lambda expression
-		selection = collection[ selection ]
+		yield pre
+
+		# Each element is followed by the seperator at its index
+		for ( index, element ) in enumerate( selected ):
 
-		# This reduce iterates over selection and sep
-		# and joins the former using the latter
-		return ft.reduce( lambda acc, x: 
-			acc + str ( selection[ x ] ) + sep[ x ], 
-			range( len( selection ) ), 
-			pre 
-			) + end
+			yield str( element )
+
+			yield sep[ index ]
 
 	# If we have a generator of seperators
 	elif( type( sep( [] ) ) == gen( type ) ):
 
 		# We get the generator for this given collection and selection
-		sep = sep( collection[ selection ] )
+		sep = sep( it.compress( collection, selection ) )
+
+		yield pre
+
+		# Each element is followed by the successive yields from sep
+		for element in selected:
+
+			yield str( element )
 
-		# Calculate the result by reducing over the selection
-		# and joining on successive yields from sep
-		return ft.reduce( lambda acc, x: 
-			acc + str ( x ) + next(sep), 
-			collection[ selection ], 
-			pre 
-			) + end
+			yield next( sep )
 
 	# Otherwise, we have run into an error
 	else:
 
 		raise( AssertionError )
 
+	yield end
+
+########################################################################
+
+def autoFormat( collection, selection, pre="", sep="", end="" ):
+	"""A subroutine for constructing complex strings 
+
+	Uses a boolean-array, `selection`, as a slice on the provided array,
+	`collection`. A complex formatted string is then formatted, which 
+	begins with `pre`, ends with `end`, and has exactly the 'elements'
+	in our slice, each seperated by `sep`
+	"""
+
+	# The chunks are joined once, so this is linear in the output
+	return "".join( autoFormatChunks( collection, selection, pre, sep, end ) )
+
+########################################################################
+
+def autoFormatStream( stream, collection, selection, pre="", sep="", end="" ):
+	"""Streaming counterpart of `autoFormat` that writes to `stream`
+
+	Each chunk is written to the file-like `stream` as soon as it is
+	made, so the whole string is never held in memory; returns the
+	number of characters written
+	"""
+
+	written = 0
+
+	for chunk in autoFormatChunks( collection, selection, pre, sep, end ):
+
+		written += stream.write( chunk ) or len( chunk )
+
+	return written
+
+########################################################################
+
+# The operator capabilities of every type looked up so far
+capabilityCache = {}
+
+########################################################################
+
+def isCompatibleType( elementType, oiqType ):
+	"""Subroutine that checks if an element of `elementType` suits `oiqType`
+
+	Besides a subclass of `oiqType`, any number suits a number type --
+	so that an int bound can be given for a float, or a bool, answer
+	type -- as numbers are compared as numbers, whatever their type
+	"""
+
+	if( issubclass( elementType, oiqType ) ):
+		return True
+
+	return issubclass( oiqType, numbers.Number ) and issubclass( elementType, numbers.Number )
+
+########################################################################
+
+def operatorCapabilities( oiqType ):
+	"""Returns the operators of `oiqType`, ready to call, by name
+
+	Every attribute is resolved along the MRO of `oiqType` -- leaving
+	out the defaults of `object` -- only the first time `oiqType` is
+	looked up, and one set to None, as with `__hash__ = None`, is left
+	out as unsupported; the comparators of number types are resolved
+	to those of `operator`, which compare numbers of any type, and the
+	comparators of numpy scalar types to their ufunc equivalents
+	"""
+
+	try:
+
+		return capabilityCache[ oiqType ]
+
+	except KeyError:
+
+		capabilities = {}
+
+		# We walk the MRO from `object` up, so that definitions
+		# nearer to `oiqType` override those they inherit -- including
+		# a None, which removes what was inherited
+		for cls in reversed( oiqType.__mro__[ : -1 ] ):
+
+			for ( name, attribute ) in vars( cls ).items():
+
+				if( attribute is None ):
+					capabilities.pop( name, None )
+				else:
+					capabilities[ name ] = attribute
+
+		if( isNumpyType( oiqType ) ):
+
+			capabilities.update( ( name, getattr( np, ufunc ) ) for ( name, ufunc ) in vectorComparators.items() )
+
+		# A slot such as `float.__le__` rejects an int bound outright,
+		# so a number is compared through `operator` instead
+		elif( issubclass( oiqType, numbers.Number ) ):
+
+			capabilities.update( 
+				( name, getattr( operator, name.strip( "_" ) ) ) for name in vectorComparators 
+				if name in capabilities 
+				)
+
+		capabilityCache[ oiqType ] = capabilities
+
+		return capabilities
+
 ########################################################################
 
 def checkOperatorType( oiqType, operatorName ):
 	"""Subroutine that checks if `oiq` & `operator` have compatible type
 
-	Checks if the `operatorName` provided is defined in the `__dict__` 
-	of `oiqType`, and then returns the bool
+	Checks if the `operatorName` provided is defined by `oiqType` --
+	or any type it inherits from -- and then returns the bool
 	"""
 
-	return ( operatorName in oiqType.__dict__ )
+	return ( operatorName in operatorCapabilities( oiqType ) )
+
+########################################################################
+
+@ft.cache
+def collectionCheckType():
+	"""Returns `CollectionCheck`, made on the first call
+
+	As an ndarray subclass it can only be made once numpy is imported
+	"""
+
+	class CollectionCheck( np.ndarray ):
+		"""The boolean-array returned by `checkCollectionType`
+
+		Knows whether it is `exhaustive` -- every element was checked,
+		or is covered by a check -- or was made by only checking a sample
+		"""
+
+		def __new__( cls, checks, exhaustive = True ):
+
+			check = np.asarray( checks, dtype = bool ).view( cls )
+
+			check.exhaustive = exhaustive
+
+			return check
+
+		def __array_finalize__( self, obj ):
+
+			self.exhaustive = getattr( obj, "exhaustive", True )
+
+	return CollectionCheck
+
+########################################################################
+
+def __getattr__( name ):
+
+	# `CollectionCheck` is only made when it is first asked for
+	if( name == "CollectionCheck" ):
+		return collectionCheckType()
+
+	raise( AttributeError( "module " + repr( __name__ ) + " has no attribute " + repr( name ) ) )
+
+########################################################################
+
+# The size above which `checkCollectionType` only checks a sample of
+# a heterogeneous collection; None to always check every element
+collectionSampleSize = None
 
 ########################################################################
 
-def checkCollectionType( oiqType, collection ):
+def checkCollectionType( oiqType, collection, sampleSize = None ):
 	"""A subroutine for checking if  `collection` has a matching type
 
 	Takes in a target type and returns a boolean-array indicating which,
-	if any, `elements` in the provided `collection` have matching type
+	if any, `elements` in the provided `collection` have matching type.
+	An ndarray is checked by its dtype alone; a collection longer than
+	`sampleSize` -- which defaults to `collectionSampleSize` -- only
+	has a random sample checked, without looking at the rest, and any
+	other collection whose elements all share one type is checked by
+	that type alone. Types match by `isCompatibleType`
 	"""
 
-	return np.array( [ ( oiqType and type( element ) ) for element in collection ] )
+	CollectionCheck = collectionCheckType()
+
+	# A typed ndarray has one type for all of its elements, so a single
+	# check covers every element
+	if( isinstance( collection, np.ndarray ) and ( collection.dtype != object ) ):
+
+		match = isCompatibleType( collection.dtype.type, oiqType )
+
+		return CollectionCheck( np.broadcast_to( match, collection.shape ) )
+
+	sampleSize = collectionSampleSize if ( sampleSize is None ) else sampleSize
+
+	# A large collection is spot-checked, so only the elements sampled
+	# are ever visited
+	if( ( sampleSize is not None ) and ( len( collection ) > sampleSize ) ):
+
+		collection = collection if isinstance( collection, co.abc.Sequence ) else list( collection )
+
+		sample = sorted( random.sample( range( len( collection ) ), sampleSize ) )
+
+		return CollectionCheck( [ isCompatibleType( type( collection[ index ] ), oiqType ) for index in sample ], exhaustive = False )
+
+	types = set( map( type, collection ) )
+
+	# A homogeneous collection is checked by its one type
+	if( len( types ) <= 1 ):
+
+		match = all( isCompatibleType( elementType, oiqType ) for elementType in types )
+
+		return CollectionCheck( np.broadcast_to( match, ( len( collection ), ) ) )
+
+	matches = { elementType : isCompatibleType( elementType, oiqType ) for elementType in types }
+
+	return CollectionCheck( [ matches[ type( element ) ] for element in collection ] )
 
 ########################################################################
 
@@ -115,12 +363,17 @@ def checkLimitType( oiqType, limit ):
 
 	Checks if the 'Object in Question', `oiq`, has a 
 	compatible type, `oiqType`, with the 'Comparison Operator', 
-	`comparator`, and `bounds` in `limit`
+	`comparator`, and `bounds` in `limit`; a `LimitIndex` checks
+	its own type instead
 	"""
+
+	if( isinstance( limit, LimitIndex ) ):
+		return limit.checkType( oiqType )
+
 	return np.array( [ 
 				checkOperatorType( oiqType, limit[ 0 ] ),
-				checkCollectionType( oiqType, limit[ 1 ][ 0 ] ),
-				checkCollectionType( oiqType, limit[ 1 ][ 1 ] ) 
+				checkCollectionType( oiqType, limit[ 1 ][ 0 ] ).all(),
+				checkCollectionType( oiqType, limit[ 1 ][ 1 ] ).all()
 			] )
 
 ########################################################################
@@ -147,16 +400,16 @@ def checkRightBounds( oiq, comparator, bounds ):
 
 ########################################################################
 
-def checkBounds( oiq, comparator, bounds ):
+def checkBounds( oiq, comparatorName, bounds ):
 	"""A subroutine for checking if `oiq` is bounded on the left & right
 
 	Checks if the 'Object in Question' is bounded on the left and right 
-	by `bounds` according to the 'Comparison Operator', `comparator`
+	by `bounds` according to the 'Comparison Operator', `comparatorName`
 	"""
 
 	# First we translate the provided name, `comparatorName`,
 	# into an actual `comparator`
-	comparator = oiqType.__dict__[ comparatorName ]
+	comparator = operatorCapabilities( type( oiq ) )[ comparatorName ]
 
 	# Then we assemble the pair by calling `checkLeftBounds` 
 	# and `checkRightBounds`
@@ -188,7 +441,7 @@ def generateLimitErrorReport( limits, limitsCheck, typeCheck = True ):
 	Takes in array of limits and another array indicating the 
 	ways in which each is either compatible / met or 
 	incompatible / failed; it then generates a user readable report 
-	of said data
+	of said data, yielding the reasons for each failed limit in turn
 	"""
 
 	# If we are generating a TypeError Report...
@@ -207,197 +460,1097 @@ def generateLimitErrorReport( limits, limitsCheck, typeCheck = True ):
 	# failure / incompatability
 	failures = checkEvery( limitsCheck, neg = True )
 
-	# Get the indices of the limits in an array
-	limIndices = np.array( range( len( limits ) ) )
-
 	# Iterate over the indices of only the limits that are
 	# specified by `failures`
-	for limitIndex in limIndices[ failures ]:
-
-		# TODO: Refactor for readability and commentability
-		yield autoFormat( 
-			[ "This Comparison Operator is incompatible\n" ] + map( lambda i : 
-				autoFormat( 
-					np.array( range( len( limits[ limitIndex ][ i + 1 ] ) ) ), 
-					limits[ limitIndex ][ i + 1 ], 
-					pre = "The " + sides[ i ] + " Bounds", 
-					sep = ", ", 
-					end = "are " + condition + "\n"
-					),
-				range(2) ) 
-	, limitsCheck[ limitIndex ], 
-			pre = "The " + str(i) + "th Limit is " + condition + " because...\n",
-			sep = "\n"
+	for limitIndex in np.flatnonzero( failures ):
+
+		( limit, limitCheck ) = ( limits[ limitIndex ], np.asarray( limitsCheck[ limitIndex ], dtype = bool ) )
+
+		reasons = [ "The " + str( limitIndex ) + "th Limit is " + condition + " because..." ]
+
+		# A `LimitIndex` is either compatible or not, and either
+		# contains `oiq` or not, so there is only one reason to give
+		if( isinstance( limit, LimitIndex ) ):
+
+			reasons.append( "The value is " + ( "incompatible with" if typeCheck else "not within" ) + " this index" )
+
+		else:
+
+			( comparatorName, bounds ) = limit
+
+			# A TypeError Report has one check for the operator
+			# followed by one check for each side
+			if( typeCheck ):
+
+				if( not limitCheck[ 0 ] ):
+					reasons.append( "This Comparison Operator, " + comparatorName + ", is incompatible" )
+
+				sideChecks = ( limitCheck[ 1 : 2 ], limitCheck[ 2 : 3 ] )
+
+				sideBounds = ( [ bounds[ 0 ] ], [ bounds[ 1 ] ] )
+
+			# A ValueError Report has one check for each bound,
+			# left bounds first and then right bounds
+			else:
+
+				sideChecks = ( limitCheck[ : len( bounds[ 0 ] ) ], limitCheck[ len( bounds[ 0 ] ) : ] )
+
+				sideBounds = bounds
+
+			for ( side, sideCheck, sideBound ) in zip( sides, sideChecks, sideBounds ):
+
+				if( not sideCheck.all() ):
+
+					reasons.append( autoFormat( 
+						np.array( [ str( bound ) for bound in sideBound ] ), 
+						~sideCheck, 
+						pre = "The " + side + " Bounds ", 
+						sep = ", ", 
+						end = " are " + condition
+						) )
+
+		yield ":\n\t" + "\n\t".join( reasons ) + "\n"
+
+########################################################################
+
+class LimitReport:
+	"""A lazily rendered report of the `limits` which were failed
+
+	Only `limits` and `limitsCheck` are kept on construction; the text
+	is assembled -- and then kept -- the first time the report is
+	`str()`-ed, so reports which are discarded unread cost nothing
+	"""
+
+	def __init__( self, limits, limitsCheck, typeCheck = False ):
+
+		( self.limits, self.limitsCheck, self.typeCheck ) = ( limits, limitsCheck, typeCheck )
+
+		self.__text = None
+
+	####################################################################
+
+	def __str__( self ):
+
+		if( self.__text is None ):
+
+			self.__text = autoFormat( *self.__formatArgs() )
+
+		return self.__text
+
+	####################################################################
+
+	def __formatArgs( self ):
+		"""Returns the arguments for formatting the report
+
+		The limits are formatted by `autoFormat` with a `sep`
+		generator given by `generateLimitErrorReport`
+		"""
+
+		pre = ( 
+			"The following limit(s) do not have compatible type(s):\n" if self.typeCheck else
+			"The following limit(s) are not met:\n" 
 			)
 
+		return ( 
+			( repr( limit ) for limit in self.limits ), 
+			checkEvery( self.limitsCheck, neg = True ),
+			pre,
+			( lambda selection : generateLimitErrorReport( self.limits, self.limitsCheck, self.typeCheck ) )
+			)
+
+	####################################################################
+
+	def write( self, stream ):
+		"""Writes the report to the file-like `stream` chunk by chunk
+
+		Unlike `str()`, nothing is kept, so very large reports can be
+		logged without holding all of their text in memory
+		"""
+
+		if( self.__text is not None ):
+			return stream.write( self.__text )
+
+		return autoFormatStream( stream, *self.__formatArgs() )
+
+	####################################################################
+
+	def __repr__( self ):
+
+		return "<LimitReport of " + str( checkEvery( self.limitsCheck, neg = True ).sum() ) + " failed limit(s)>"
+
+	####################################################################
+
+	def __iter__( self ):
+
+		return iter( self.limitsCheck )
+
+	####################################################################
+
+	def __getitem__( self, index ):
+
+		return self.limitsCheck[ index ]
+
 ########################################################################
 
-def checkLimits( oiq, limits, verbose = False ):
-	"""Fault-tolerant subroutine, checks if `oiq` meets `limits`
+class LRUCache:
+	"""A bounded mapping which evicts the least-recently-used entry
 
-	First checks Type and Value to ensure that `limits` are 
-	compatible with `oiq` before then -- supposing the Type and 
-	Value checks arepassed -- checking if the `limits` are met by
-	`oiq`
+	Counts `hits` and `misses` on `get`, and evicts from the cold end
+	whenever `put` would grow it beyond `maxsize` entries
 	"""
 
-	# First we will type-check the oiq against the `limits`' 'Comparison Operators',
-	# `comparator`s,  and `bounds`
-	try:
+	__slots__ = ( "maxsize", "hits", "misses", "__entries" )
 
-		# So we assign `oiqType`
-		oiqType = type( oiq )
+	def __init__( self, maxsize = 128 ):
 
-		# We assert that every element in this array be True where this array is checking if the type of
-		# each limit is compatible with the 'Object in Question', `oiq`
-		limitsTypeCheck = np.array( [ 
-			np.array( [ 
-				checkOperatorType( oiqType, comparatorName ),
-				checkCollectionType( oiqType, leftBounds ),
-				checkCollectionType( oiqType, rightBounds ) 
-			] )
-		for ( comparatorName, ( leftBounds, rightBounds ) ) in limits
-		] )
+		self.maxsize = maxsize
 
-		assert checkEvery( limitsTypeCheck ).all()
+		( self.hits, self.misses ) = ( 0, 0 )
 
-	# In the case that our assertion fails, we raise a TypeError 
-	except AssertionError:
+		self.__entries = co.OrderedDict()
 
-		raise( TypeError( autoFormat( limits, checkEvery( limitsTypeCheck, neg = True ), 
-			pre = "The following limit(s) do not have compatible type(s):\n", 
-			sep = generateLimitErrorReport( limits, limitsTypeCheck )
-		) ) )
+	####################################################################
 
-	# Otherwise, we will then go about checking if the `limits` are met by `oiq`
-	else:
+	def __len__( self ):
+
+		return len( self.__entries )
+
+	####################################################################
+
+	def __contains__( self, key ):
+
+		return ( key in self.__entries )
+
+	####################################################################
+
+	def get( self, key, default = None ):
+		"""Returns the entry for `key`, marking it most-recently-used
+
+		Returns `default` -- and counts a miss -- if there is no entry
+		"""
 
 		try:
 
-			# We assert that every element in this array be True where this array is checking if
-			# each limit is met by the 'Object in Question'
-			limitsCheck = np.array( [
-				checkBounds( oiq, comparatorName, bounds )
-				for ( comparatorName, bounds ) in limits
-				] )
+			value = self.__entries[ key ]
 
-			assert checkEvery( limitsCheck ).all()
+		except KeyError:
 
-		# In the case that our assertion fails, we either return 
-		# `limitsCheck` or we raise a ValueError
-		# depending on the value of `verbose`
-		except AssertionError:
+			self.misses += 1
 
-			if( verbose ):
-				return limitsCheck
-			else:
+			return default
 
-				# The ValueError we raise is generated using the
-				# application of `autoFormat` to `limit`
-				# and the application of `checkEvery` on 
-				# limitsCheck in `neg` mode, with
-				# a `sep` generator given by
-				# `generateLimitErrorReport`
-				raise( ValueError( 
-					autoFormat( 
-						limits, 
-						checkEvery( limitsCheck, neg = True ),
-					pre = "The following limit(s) are not met:\n",
-					sep = generateLimitErrorReport( 
-						limits, 
-						limitsCheck, 
-						typeCheck = False 
-						) 
-				) ) )
-
-		# Otherwise, we will return True because all limits are met by the `oiq`
-		else:
-			return True
+		self.__entries.move_to_end( key )
+
+		self.hits += 1
+
+		return value
+
+	####################################################################
+
+	def put( self, key, value ):
+		"""Stores `value` under `key`, evicting if over `maxsize`"""
+
+		self.__entries[ key ] = value
+
+		self.__entries.move_to_end( key )
+
+		while( len( self.__entries ) > self.maxsize ):
+
+			self.__entries.popitem( last = False )
+
+	####################################################################
+
+	def pop( self, key, default = None ):
+
+		return self.__entries.pop( key, default )
+
+	####################################################################
+
+	def clear( self ):
+
+		self.__entries.clear()
+
+		( self.hits, self.misses ) = ( 0, 0 )
+
+	####################################################################
+
+	def stats( self ):
+		"""Returns the size, hits, misses, and hit rate of the cache"""
+
+		lookups = self.hits + self.misses
+
+		return { 
+			"size" : len( self ), 
+			"maxsize" : self.maxsize, 
+			"hits" : self.hits, 
+			"misses" : self.misses, 
+			"hitRate" : ( self.hits / lookups ) if lookups else 0.0 
+			}
 
 ########################################################################
 
-def askUserRTI(	question, answerTypeName, answerLimits = None ):
-	"""A fault-tolerant subroutine for asking for real-time input
+class LimitIndex( ABC ):
+	"""Abstract-Base-Class for limits which index their allowed values
 
-	Takes a plain-text question and gets a Type and Value checked
-	answer that also meets any additional Limits imposed
+	A `LimitIndex` can be given in `limits` next to the usual
+	`( comparatorName, ( leftBounds, rightBounds ) )` tuples, and
+	answers membership itself rather than through a `comparator`
 	"""
 
-	answered = False
+	@abstractmethod
+	def checkType( self, oiqType ):
+		"""Abstract method for checking compatibility with `oiqType`
 
-	# First we ensure that our `answerTypeName` is well-defined
-	try:
+		Any derived LimitIndex must return a boolean-array shaped
+		like the one returned by `checkLimitType`
+		"""
 
-		answerType = globals()[ answerTypeName ]
+		pass
 
-	# If the `answerType` is unable to be retrieved we first check if
-	# the type exists in `builtins` before raising the error
-	except KeyError as e:
+	####################################################################
 
-		try:
-			answerType = globals()[ "__builtins__" ].__dict__[ answerTypeName ]
-		except:
-			raise( e )
-		
-	# Finally we use the `answerType` as our constructor on `answer`
-	finally:
+	@abstractmethod
+	def contains( self, oiq ):
+		"""Abstract method for checking if `oiq` is an allowed value
 
-		while( not answered ):
+		Any derived LimitIndex must return a plain bool, as this is
+		used on the fast path of `LimitValidator`
+		"""
 
-			# To get `answer` we ask `question`
-			answer = input( "|| " + question + "\n\\\\>>>\t" )
+		pass
 
-			# We then want to see if `answerType` is able to act on `answer` without error
-			try:
+	####################################################################
 
-				answer = answerType( answer )
+	def check( self, oiq ):
+		"""Returns the result of `contains` as a boolean-array"""
 
-			# If answerType is unable to coerce strings, we raise the TypeError
-			except TypeError as e:
+		return np.array( [ self.contains( oiq ) ] )
 
-				# We simply raise the answer -- instead of alerting the user -- this is
-				# because answerType -- although defined -- is not a valid choice
-				# as it is unable to coerce text input from the user
-				raise( e )
+	####################################################################
+
+	@abstractmethod
+	def checkMany( self, values ):
+		"""Abstract method for checking an array of `values` at once
+
+		Any derived LimitIndex must return a boolean-array with an
+		element for each value
+		"""
+
+		pass
+
+########################################################################
+
+class IntervalIndex( LimitIndex ):
+	"""A limit allowing any value within one of many closed intervals
+
+	The `intervals` are sorted and merged on construction, so that
+	redundant bounds are collapsed and membership is a binary search
+	"""
+
+	def __init__( self, intervals ):
+
+		merged = []
+
+		# We sweep over the intervals in order of their left bound,
+		# extending the last merged interval whenever they overlap
+		for ( left, right ) in sorted( intervals ):
+
+			if( left > right ):
+				continue
+
+			if( merged and ( left <= merged[ -1 ][ 1 ] ) ):
+
+				merged[ -1 ][ 1 ] = max( merged[ -1 ][ 1 ], right )
 
-			# If answerType is unable to coerce the specific string given, we request
-			# a new answer from the user
-			except ValueError as e:
-
-				
-				errorMessage =	( 
-								"||\n" + "VV\n||\n" +
-								"|]===[ Sorry! Your answer isn't valid!\n||\n \\\\\n"+
-								"  |]===[ The `ValueError` is printed below, and it means that your \n" +
-							   	"  |]===[ answer doesn't fall within the range of strings that\n" +
-							   	"  |]===[ the answer type for this question is able to understand.\n" +
-							   	"  ||\n" + "  VV\n" +
-							   	"  ||"
-							   	"  |]===[ Once you understand how to correct your answer, please try again.\n\n" 
-							   	)
-
-				# First, we tell the user about the error and that we are going to describe it
-				print( errorMessage )
-
-				# Then, we pass along the `ValueError` text itself
-				print( "Value Error: " + str( e ) )
-
-			# If `answerType` is able to coerce the given string, then we check if
-			# `answer` is able to pass all requirements in `answerLimits` 
 			else:
-				
-				if( answerLimits ):
 
-					limitsCheck = checkLimits( answer, answerLimits, verbose = True )
+				merged.append( [ left, right ] )
 
-					if( checkEvery( np.array( [ checkEvery( subcollection ).all() for subcollection in limitsCheck ] )  ).all() ):
-						answered = True
-					else:
-						print( "Limits Failed!" )
-				else:
-					answered = True
+		( self.lefts, self.rights ) = ( [ i[ 0 ] for i in merged ], [ i[ 1 ] for i in merged ] )
 
-			
-		return answer
+		( self.leftArray, self.rightArray ) = ( np.array( self.lefts ), np.array( self.rights ) )
+
+	####################################################################
+
+	def __len__( self ):
+
+		return len( self.lefts )
+
+	####################################################################
+
+	def __repr__( self ):
+
+		return "IntervalIndex(" + repr( list( zip( self.lefts, self.rights ) ) ) + ")"
+
+	####################################################################
+
+	def checkType( self, oiqType ):
+
+		return checkLimitType( oiqType, ( "__le__", ( self.lefts, self.rights ) ) )
+
+	####################################################################
+
+	def contains( self, oiq ):
+
+		index = bisect.bisect_right( self.lefts, oiq ) - 1
+
+		return ( ( index >= 0 ) and bool( oiq <= self.rights[ index ] ) )
+
+	####################################################################
+
+	def checkMany( self, values ):
+
+		values = np.asarray( values )
+
+		if( not len( self ) ):
+			return np.zeros( values.shape, dtype = bool )
+
+		indices = np.searchsorted( self.leftArray, values, side = "right" ) - 1
+
+		return ( indices >= 0 ) & ( values <= self.rightArray[ np.maximum( indices, 0 ) ] )
+
+########################################################################
+
+class DomainMask( LimitIndex ):
+	"""A limit allowing only the integers in a small discrete domain
+
+	The `domain` is stored both as an integer bitmask, `mask`, and as
+	a boolean lookup table, `table`, both offset by the smallest value;
+	so a single check is one mask test and a batch is one `np.take`;
+	a domain spanning more than `maxSpan` integers is rejected, as the
+	table grows with the span and not with the number of values
+	"""
+
+	maxSpan = 1 << 16
+
+	def __init__( self, domain ):
+
+		domain = sorted( set( int( value ) for value in domain ) )
+
+		if( domain and ( domain[ -1 ] - domain[ 0 ] >= self.maxSpan ) ):
+			raise( ValueError( "A DomainMask may span at most " + str( self.maxSpan ) + " integers, but " + repr( domain[ 0 ] ) + " to " + repr( domain[ -1 ] ) + " spans " + str( domain[ -1 ] - domain[ 0 ] + 1 ) + "; use an IntervalIndex" ) )
+
+		self.offset = domain[ 0 ] if domain else 0
+
+		self.mask = sum( 1 << ( value - self.offset ) for value in domain )
+
+		self.table = np.zeros( ( domain[ -1 ] - self.offset + 1 ) if domain else 0, dtype = bool )
+
+		self.table[ [ value - self.offset for value in domain ] ] = True
+
+	####################################################################
+
+	def __len__( self ):
+
+		return int( self.table.sum() )
+
+	####################################################################
+
+	def __repr__( self ):
+
+		return "DomainMask(" + repr( ( np.flatnonzero( self.table ) + self.offset ).tolist() ) + ")"
+
+	####################################################################
+
+	def checkType( self, oiqType ):
+
+		return np.array( [ issubclass( oiqType, ( int, np.integer ) ) ] * 3 )
+
+	####################################################################
+
+	def contains( self, oiq ):
+
+		# A numpy integer is made a python int, which shifts the mask
+		# without overflowing however wide it is
+		shift = int( oiq ) - self.offset
+
+		return ( ( shift >= 0 ) and bool( ( self.mask >> shift ) & 1 ) )
+
+	####################################################################
+
+	def checkMany( self, values ):
+
+		values = np.asarray( values )
+
+		# We compare against the domain's ends before shifting, as a
+		# shift in a narrow dtype could wrap, or overflow, into it
+		inDomain = ( values >= self.offset ) & ( values < self.offset + len( self.table ) )
+
+		if( not len( self.table ) ):
+			return inDomain
+
+		shifts = values.astype( np.int64 ) - self.offset
+
+		# Values outside of the table are clipped onto it for the
+		# `np.take`, and then masked out by `inDomain`
+		return inDomain & np.take( self.table, shifts, mode = "clip" )
+
+########################################################################
+
+def tightenBounds( comparatorName, bounds ):
+	"""Returns only the tightest of the left and right `bounds`
+
+	For an ordering only the tightest bound on each side can fail, so
+	the rest need never be compared; `bounds` are returned as they are
+	unless every bound is a real number -- other than NaN -- or every
+	bound is a string, as only those are known to be totally ordered
+	"""
+
+	( leftBounds, rightBounds ) = bounds
+
+	allBounds = ( *leftBounds, *rightBounds )
+
+	if( ( comparatorName not in tightestBounds ) or ( not allBounds ) ):
+		return ( leftBounds, rightBounds )
+
+	ordered = ( 
+		all( isinstance( bound, numbers.Real ) and ( bound == bound ) for bound in allBounds ) or 
+		all( isinstance( bound, str ) for bound in allBounds ) 
+		)
+
+	if( not ordered ):
+		return ( leftBounds, rightBounds )
+
+	# The reductions are named as numpy's, which builtins shares
+	( tightestLeft, tightestRight ) = ( vars( builtins )[ reduction ] for reduction in tightestBounds[ comparatorName ] )
+
+	return ( 
+		( tightestLeft( leftBounds ), ) if leftBounds else (), 
+		( tightestRight( rightBounds ), ) if rightBounds else () 
+		)
+
+########################################################################
+
+class LimitValidator:
+	"""A reusable validator for `limits` compiled against `oiqType`
+
+	The type-compatibility pass and the translation of each
+	'Comparison Operator' name into a ready-to-call `comparator` are
+	done once on construction, so calling the validator only does the comparisons
+	"""
+
+	def __init__( self, limits, oiqType ):
+
+		( self.limits, self.oiqType ) = ( limits, oiqType )
+
+		# We assert that every element in this array be True where this array is checking if the type of
+		# each limit is compatible with the 'Object in Question', `oiq`
+		limitsTypeCheck = np.array( [ checkLimitType( oiqType, limit ) for limit in limits ] )
+
+		# In the case that our assertion fails, we raise a TypeError 
+		if( not checkEvery( limitsTypeCheck ).all() ):
+
+			raise( TypeError( LimitReport( limits, limitsTypeCheck, typeCheck = True ) ) )
+
+		# A `LimitIndex` has no `comparator`, as it checks `oiq` itself
+		self.comparators = tuple( 
+			None if isinstance( limit, LimitIndex ) else operatorCapabilities( oiqType )[ limit[ 0 ] ] 
+			for limit in limits 
+			)
+
+		# The plan used by the fast path of `isMet`, with the bounds of
+		# each limit unpacked -- and tightened -- ahead of time; `check`
+		# still uses every bound, so that reports name them all
+		self.__plan = tuple( 
+			( comparator, limit, () ) if ( comparator is None ) else ( comparator, *tightenBounds( limit[ 0 ], limit[ 1 ] ) )
+			for ( comparator, limit ) in zip( self.comparators, limits )
+			)
+
+	####################################################################
+
+	def isMet( self, oiq ):
+		"""Fast path, checks if `oiq` meets every one of the `limits`
+
+		Returns a plain bool as soon as the answer is known, without
+		allocating any arrays along the way
+		"""
+
+		for ( comparator, leftBounds, rightBounds ) in self.__plan:
+
+			if( comparator is None ):
+
+				if( not leftBounds.contains( oiq ) ):
+					return False
+
+				continue
+
+			for bound in leftBounds:
+
+				if( not comparator( bound, oiq ) ):
+					return False
+
+			for bound in rightBounds:
+
+				if( not comparator( oiq, bound ) ):
+					return False
+
+		return True
+
+	####################################################################
+
+	def check( self, oiq ):
+		"""Returns `limitsCheck`, the boolean-arrays of every limit
+
+		Each limit is checked by joining its left and right checks
+		into a single boolean-array over all of its bounds
+		"""
+
+		return [
+			limit.check( oiq ) if ( comparator is None ) else np.concatenate( (
+				checkLeftBounds( oiq, comparator, limit[ 1 ][ 0 ] ),
+				checkRightBounds( oiq, comparator, limit[ 1 ][ 1 ] )
+				) ).astype( bool )
+			for ( comparator, limit ) in zip( self.comparators, self.limits )
+			]
+
+	####################################################################
+
+	def __call__( self, oiq, verbose = False ):
+		"""Checks if `oiq` meets every one of the compiled `limits`
+
+		Returns True if it does, otherwise either returns a
+		`LimitReport` or raises a ValueError with one depending on the
+		value of `verbose`
+		"""
+
+		if( self.isMet( oiq ) ):
+			return True
+
+		# Only once a limit has failed do we build `limitsCheck`, which
+		# the `LimitReport` renders only if it is ever read
+		report = LimitReport( self.limits, self.check( oiq ), typeCheck = False )
+
+		if( verbose ):
+			return report
+
+		raise( ValueError( report ) )
+
+########################################################################
+
+# The compiled validators, keyed on `( oiqType, limits )`
+limitValidatorCache = LRUCache( maxsize = 256 )
+
+# The compiled validators of immutable `limits`, keyed on their identity;
+# each entry holds on to its `limits`, so that the identity is not reused
+limitIdentityCache = LRUCache( maxsize = 256 )
+
+########################################################################
+
+def normalizeLimits( limits ):
+	"""Returns `limits` with every sequence of bounds as a tuple"""
+
+	return tuple( 
+		limit if isinstance( limit, LimitIndex ) else
+		( limit[ 0 ], ( tuple( limit[ 1 ][ 0 ] ), tuple( limit[ 1 ][ 1 ] ) ) ) 
+		for limit in limits 
+		)
+
+########################################################################
+
+def limitsKey( limits ):
+	"""Returns a hashable key equivalent to `limits`
+
+	Each bound is paired with its type, as bounds which are equal --
+	such as `1` and `1.0` -- need not pass the same type check; a
+	TypeError is raised if a bound itself is unhashable
+	"""
+
+	key = tuple( 
+		limit if isinstance( limit, LimitIndex ) else
+		( limit[ 0 ], tuple( tuple( ( type( bound ), bound ) for bound in bounds ) for bounds in limit[ 1 ] ) ) 
+		for limit in limits 
+		)
+
+	hash( key )
+
+	return key
+
+########################################################################
+
+def compileLimits( limits, oiqType ):
+	"""Returns a cached `LimitValidator` of `limits` for `oiqType`
+
+	Validators are kept in `limitValidatorCache`, so the type pass is
+	only repeated once a validator has been evicted; limits that
+	cannot be hashed are compiled without being cached. Limits made
+	of tuples alone cannot change, so they are first looked up by
+	identity, without walking their bounds
+	"""
+
+	immutable = isinstance( limits, tuple ) and all( 
+		isinstance( limit, LimitIndex ) or ( 
+			isinstance( limit, tuple ) and isinstance( limit[ 1 ], tuple ) and 
+			isinstance( limit[ 1 ][ 0 ], tuple ) and isinstance( limit[ 1 ][ 1 ], tuple ) 
+			)
+		for limit in limits 
+		)
+
+	if( immutable ):
+
+		entry = limitIdentityCache.get( ( oiqType, id( limits ) ) )
+
+		if( ( entry is not None ) and ( entry[ 0 ] is limits ) ):
+			return entry[ 1 ]
+
+	try:
+
+		key = ( oiqType, limitsKey( limits ) )
+
+	except TypeError:
+
+		return LimitValidator( limits, oiqType )
+
+	validator = limitValidatorCache.get( key )
+
+	if( validator is None ):
+
+		validator = LimitValidator( normalizeLimits( limits ), oiqType )
+
+		limitValidatorCache.put( key, validator )
+
+	if( immutable ):
+
+		limitIdentityCache.put( ( oiqType, id( limits ) ), ( limits, validator ) )
+
+	return validator
+
+########################################################################
+
+def checkLimits( oiq, limits, verbose = False ):
+	"""Fault-tolerant subroutine, checks if `oiq` meets `limits`
+
+	First checks Type and Value to ensure that `limits` are 
+	compatible with `oiq` before then -- supposing the Type and 
+	Value checks arepassed -- checking if the `limits` are met by
+	`oiq`
+	"""
+
+	return compileLimits( limits, type( oiq ) )( oiq, verbose )
+
+########################################################################
+
+# The 'Comparison Operator' names which have an equivalent numpy ufunc,
+# named rather than held so that numpy is not imported up front
+vectorComparators = {
+	"__lt__" : "less",
+	"__le__" : "less_equal",
+	"__gt__" : "greater",
+	"__ge__" : "greater_equal",
+	"__eq__" : "equal",
+	"__ne__" : "not_equal",
+	}
+
+# The reductions giving the tightest left and right bound of an ordering
+tightestBounds = {
+	"__lt__" : ( "max", "min" ),
+	"__le__" : ( "max", "min" ),
+	"__gt__" : ( "min", "max" ),
+	"__ge__" : ( "min", "max" ),
+	}
+
+########################################################################
+
+def hasVectorComparator( dtype, comparatorName ):
+	"""Subroutine that checks if `dtype` can be compared by a ufunc
+
+	Only booleans, numbers, and datetimes are compared with broadcasting;
+	every other dtype uses the per-element path of `checkBounds`
+	"""
+
+	return ( ( comparatorName in vectorComparators ) and ( dtype.kind in "biufmM" ) )
+
+########################################################################
+
+def checkLimitsBatch( values, limits ):
+	"""Vectorized subroutine, checks if each of `values` meets `limits`
+
+	Returns a boolean-matrix with a row for each value and a column for
+	each limit, where an element is True only if that value is bounded
+	on the left and right by every bound of that limit
+	"""
+
+	values = np.asarray( values )
+
+	limitsCheck = np.empty( ( len( values ), len( limits ) ), dtype = bool )
+
+	for ( limitIndex, limit ) in enumerate( limits ):
+
+		# A `LimitIndex` checks the whole batch of values itself
+		if( isinstance( limit, LimitIndex ) ):
+
+			limitsCheck[ :, limitIndex ] = limit.checkMany( values )
+
+			continue
+
+		( comparatorName, ( leftBounds, rightBounds ) ) = limit
+
+		( lefts, rights ) = ( np.asarray( leftBounds ), np.asarray( rightBounds ) )
+
+		# If every dtype involved has a ufunc, we broadcast the values
+		# against the bounds and reduce over the bounds' axis
+		if( all( hasVectorComparator( array.dtype, comparatorName ) for array in ( values, lefts, rights ) ) ):
+
+			comparator = getattr( np, vectorComparators[ comparatorName ] )
+
+			# For an ordering only the tightest bound on each side
+			# can fail, so the rest are collapsed before broadcasting
+			if( comparatorName in tightestBounds ):
+
+				( tightestLeft, tightestRight ) = ( getattr( np, reduction ) for reduction in tightestBounds[ comparatorName ] )
+
+				lefts = tightestLeft( lefts, keepdims = True ) if lefts.size else lefts
+
+				rights = tightestRight( rights, keepdims = True ) if rights.size else rights
+
+			limitsCheck[ :, limitIndex ] = (
+				comparator( lefts[ None, : ], values[ :, None ] ).all( axis = 1 ) &
+				comparator( values[ :, None ], rights[ None, : ] ).all( axis = 1 )
+				)
+
+		# Otherwise, we fall back to checking one value at a time
+		else:
+
+			limitsCheck[ :, limitIndex ] = [
+				all( sideCheck.all() for sideCheck in checkBounds( value, comparatorName, ( leftBounds, rightBounds ) ) )
+				for value in values.tolist()
+				]
+
+	return limitsCheck
+
+########################################################################
+
+def resolveAnswerType( answerTypeName ):
+	"""Subroutine for retrieving the type named `answerTypeName`
+
+	The type is looked for in this module first, and then in
+	`builtins`; the KeyError is raised if it is found in neither
+	"""
+
+	try:
+
+		return globals()[ answerTypeName ]
+
+	# If the `answerType` is unable to be retrieved we first check if
+	# the type exists in `builtins` before raising the error
+	except KeyError as e:
+
+		try:
+			return vars( builtins )[ answerTypeName ]
+		except:
+			raise( e )
+
+class Coercer:
+	"""A cached coercer of strings into answers of type `answerType`
+
+	Calling the coercer coerces a single string with `answerType`
+	itself; `many` coerces a whole column of strings into an ndarray
+	in one call, using `dtype` -- anything `astype` accepts, such as a
+	dtype's name -- when there is one
+	"""
+
+	__slots__ = ( "type", "dtype", "native" )
+
+	def __init__( self, answerType, dtype = None ):
+
+		( self.type, self.dtype ) = ( answerType, dtype )
+
+		# A native -- i.e. not numpy -- type has its values unpacked
+		# back into python objects by `unpack`
+		self.native = not isNumpyType( answerType )
+
+	####################################################################
+
+	def __repr__( self ):
+
+		return "Coercer(" + self.type.__name__ + ", " + str( None if ( self.dtype is None ) else np.dtype( self.dtype ) ) + ")"
+
+	####################################################################
+
+	def __call__( self, string ):
+
+		return self.type( string )
+
+	####################################################################
+
+	def many( self, strings ):
+		"""Coerces a column of `strings` into an ndarray in one call
+
+		Raises a ValueError -- or an OverflowError -- if any of the
+		strings cannot be coerced, as a cast would
+		"""
+
+		if( self.dtype is None ):
+
+			# Without a dtype we can only coerce one string at a time
+			values = np.empty( len( strings ), dtype = object )
+
+			values[ : ] = [ self.type( string ) for string in strings ]
+
+			return values
+
+		return np.asarray( strings, dtype = str ).astype( self.dtype )
+
+	####################################################################
+
+	def unpack( self, values ):
+		"""Returns the elements of `values` as `__call__` would give them"""
+
+		return values.tolist() if self.native else list( values )
+
+########################################################################
+
+# The coercers for every answer type name, which are precomputed for
+# the builtin types, and otherwise made when needed
+coercers = {
+	"int" : Coercer( int, "int64" ),
+	"float" : Coercer( float, "float64" ),
+	"complex" : Coercer( complex, "complex128" ),
+	"bool" : Coercer( bool, "bool_" ),
+	"str" : Coercer( str, "str_" ),
+	}
+
+# The numpy scalar types which can be named as answer types, whose
+# coercers are made -- importing numpy -- when they are first needed
+numpyAnswerTypes = frozenset( (
+	"int8", "int16", "int32", "int64",
+	"uint8", "uint16", "uint32", "uint64",
+	"float16", "float32", "float64",
+	"complex64", "complex128", "bool_", "str_",
+	) )
+
+########################################################################
+
+def resolveCoercer( answerTypeName ):
+	"""Returns the `Coercer` for the type named `answerTypeName`
+
+	Names that are not yet in `coercers` are resolved once -- from
+	numpy if they are in `numpyAnswerTypes`, otherwise by
+	`resolveAnswerType` -- and their coercer is then kept
+	"""
+
+	try:
+
+		return coercers[ answerTypeName ]
+
+	except KeyError:
+
+		if( answerTypeName in numpyAnswerTypes ):
+
+			answerType = getattr( np, answerTypeName )
+
+			coercer = coercers[ answerTypeName ] = Coercer( answerType, answerType )
+
+		else:
+
+			coercer = coercers[ answerTypeName ] = Coercer( resolveAnswerType( answerTypeName ) )
+
+		return coercer
+
+########################################################################
+
+def askUserRTI(	question, answerTypeName, answerLimits = None, answers = None ):
+	"""A fault-tolerant subroutine for asking for real-time input
+
+	Takes a plain-text question and gets a Type and Value checked
+	answer that also meets any additional Limits imposed. If an
+	iterator of `answers` is given, the next of them is used instead
+	of prompting, and an invalid answer raises instead of re-asking
+	"""
+
+	answered = False
+
+	validator = None
+
+	# First we ensure that our `answerTypeName` is well-defined
+	coercer = resolveCoercer( answerTypeName )
+
+	answerType = coercer.type
+
+	# The `answerLimits` are compiled once for every answer we check
+	if( answerLimits ):
+
+		validator = compileLimits( answerLimits, answerType )
+
+	# Then we use the `answerType` as our constructor on `answer`
+	while( not answered ):
+
+		# To get `answer` we ask `question`, unless we already have it
+		if( answers is None ):
+
+			answer = input( "|| " + question + "\n\\\\>>>\t" )
+
+		else:
+
+			# Running out of answers is an invalid answer, too
+			try:
+				answer = next( answers )
+			except StopIteration:
+				raise( ValueError( "No answer was given to: " + question ) )
+
+		# We then want to see if `answerType` is able to act on `answer` without error
+		try:
+
+			answer = coercer( answer )
+
+		# If answerType is unable to coerce strings, we raise the TypeError
+		except TypeError as e:
+
+			# We simply raise the answer -- instead of alerting the user -- this is
+			# because answerType -- although defined -- is not a valid choice
+			# as it is unable to coerce text input from the user
+			raise( e )
+
+		# If answerType is unable to coerce the specific string given, we request
+		# a new answer from the user
+		except ValueError as e:
+
+			# Without a user to ask again, we can only raise
+			if( answers is not None ):
+				raise( e )
+			
+			errorMessage =	( 
+							"||\n" + "VV\n||\n" +
+							"|]===[ Sorry! Your answer isn't valid!\n||\n \\\\\n"+
+							"  |]===[ The `ValueError` is printed below, and it means that your \n" +
+						   	"  |]===[ answer doesn't fall within the range of strings that\n" +
+						   	"  |]===[ the answer type for this question is able to understand.\n" +
+						   	"  ||\n" + "  VV\n" +
+						   	"  ||"
+						   	"  |]===[ Once you understand how to correct your answer, please try again.\n\n" 
+						   	)
+
+			# First, we tell the user about the error and that we are going to describe it
+			print( errorMessage )
+
+			# Then, we pass along the `ValueError` text itself
+			print( "Value Error: " + str( e ) )
+
+		# If `answerType` is able to coerce the given string, then we check if
+		# `answer` is able to pass all requirements in `answerLimits` 
+		else:
+			
+			if( validator ):
+
+				report = validator( answer, verbose = answers is None )
+
+				if( report is True ):
+					answered = True
+				else:
+					print( "Limits Failed!" )
+					print( report )
+			else:
+				answered = True
+
+		
+	return answer
+
+########################################################################
+
+def validateLines( lines, coercer, validator = None ):
+	"""Subroutine validating `lines` one at a time for `validateStream`
+
+	Yields the `( value, ok, report )` of each line, using `coercer`
+	and -- if there is one -- `validator`
+	"""
+
+	for line in lines:
+
+		# As with `askUserRTI`, a TypeError means `answerType` is unable
+		# to coerce strings at all, so it is simply raised
+		line = line.rstrip( "\n" )
+
+		try:
+
+			value = coercer( line )
+
+		except ValueError as e:
+
+			yield ( line, False, e )
+
+			continue
+
+		if( validator is None ):
+
+			yield ( value, True, None )
+
+			continue
+
+		report = validator( value, verbose = True )
+
+		yield ( value, True, None ) if ( report is True ) else ( value, False, report )
+
+########################################################################
+
+def validateChunk( lines, answerTypeName, answerLimits = None ):
+	"""Subroutine validating a chunk of `lines` for `validateStream`
+
+	Returns a list of the `( value, ok, report )` tuples of `lines`,
+	and -- being a module level function -- can be sent to a pool
+	"""
+
+	return list( validateStream( lines, answerTypeName, answerLimits ) )
+
+########################################################################
+
+def validateStream( lines, answerTypeName, answerLimits = None, pool = None, chunksize = 1024, window = 8 ):
+	"""A generator for validating many answers without prompting
+
+	The bulk counterpart of `askUserRTI`: each of `lines` is coerced by
+	the type named `answerTypeName` and checked against `answerLimits`,
+	yielding `( value, ok, report )` where `report` is None, the
+	ValueError of the coercion, or a `LimitReport`. `lines` are read
+	lazily in chunks of `chunksize`, each coerced as a column; if a
+	`pool` is given, the chunks are validated in it, with at most
+	`window` chunks in flight at once
+	"""
+
+	# If we have a pool, we hand it chunks and yield their results in order
+	if( pool is not None ):
+
+		( lines, pending ) = ( iter( lines ), co.deque() )
+
+		for chunk in iter( lambda : list( it.islice( lines, chunksize ) ), [] ):
+
+			pending.append( pool.apply_async( validateChunk, ( chunk, answerTypeName, answerLimits ) ) )
+
+			if( len( pending ) >= window ):
+
+				yield from pending.popleft().get()
+
+		while( pending ):
+
+			yield from pending.popleft().get()
+
+		return
+
+	coercer = resolveCoercer( answerTypeName )
+
+	validator = compileLimits( answerLimits, coercer.type ) if answerLimits else None
+
+	lines = iter( lines )
+
+	# Each chunk of lines is coerced as a column, and checked by
+	# `checkLimitsBatch`; only failures are checked one at a time
+	for chunk in iter( lambda : list( it.islice( lines, chunksize ) ), [] ):
+
+		try:
+
+			values = coercer.many( [ line.rstrip( "\n" ) for line in chunk ] )
+
+		# If any line is unable to be coerced, we find which by
+		# coercing the chunk one line at a time
+		except ( ValueError, OverflowError ):
+
+			yield from validateLines( chunk, coercer, validator )
+
+			continue
+
+		oks = checkLimitsBatch( values, answerLimits ).all( axis = 1 ) if validator else it.repeat( True )
+
+		for ( value, ok ) in zip( coercer.unpack( values ), oks ):
+
+			report = True if ok else validator( value, verbose = True )
+
+			yield ( value, True, None ) if ( report is True ) else ( value, False, report )
 
 ########################################################################